@@ -1,6 +1,13 @@
 """Claude Code Statusline - Context usage tracking for Claude Code."""
 
-from importlib.metadata import version
-
-__version__ = version("claude-code-statusline")
 __all__ = ["__version__"]
+
+
+def __getattr__(name: str) -> str:
+    # Resolved on first access: importlib.metadata is slow to import and the
+    # version is only needed by --version and the doctor command
+    if name == "__version__":
+        from importlib.metadata import version
+
+        return version("claude-code-statusline")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
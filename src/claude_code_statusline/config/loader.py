@@ -4,15 +4,13 @@ import os
 
 from pathlib import Path
 
-import yaml
-
 from pydantic import ValidationError
 
 from .defaults import get_default_widgets
 from .schema import StatusLineConfigV2, WidgetConfigModel, WidgetOverride
 
 _cached_config: StatusLineConfigV2 | None = None
-_cached_mtime: float = 0.0
+_cached_mtime_ns: int = 0
 
 
 def get_config_dir() -> Path:
@@ -32,23 +30,25 @@ def load_config_file() -> StatusLineConfigV2:
     Returns:
         StatusLineConfigV2 with user overrides, or empty config if none exists
     """
-    global _cached_config, _cached_mtime
+    global _cached_config, _cached_mtime_ns
 
     config_path = get_config_path()
 
-    if _cached_config is not None:
-        try:
-            current_mtime = config_path.stat().st_mtime
-            if current_mtime == _cached_mtime:
-                return _cached_config
-        except OSError:
-            pass
-
-    if not config_path.exists():
+    try:
+        st: os.stat_result | None = os.stat(config_path)
+    except FileNotFoundError:
         config = StatusLineConfigV2()
         _cached_config = config
-        _cached_mtime = 0.0
+        _cached_mtime_ns = 0
         return config
+    except OSError:
+        st = None
+
+    if _cached_config is not None and st is not None:
+        if st.st_mtime_ns == _cached_mtime_ns:
+            return _cached_config
+
+    import yaml
 
     try:
         with open(config_path, encoding="utf-8") as f:
@@ -61,15 +61,12 @@ def load_config_file() -> StatusLineConfigV2:
             config_path.unlink()
             config = StatusLineConfigV2()
             _cached_config = config
-            _cached_mtime = 0.0
+            _cached_mtime_ns = 0
             return config
 
         config = StatusLineConfigV2(**data)
         _cached_config = config
-        try:
-            _cached_mtime = config_path.stat().st_mtime
-        except OSError:
-            _cached_mtime = 0.0
+        _cached_mtime_ns = st.st_mtime_ns if st is not None else 0
 
         return config
 
@@ -84,25 +81,38 @@ def load_config_file() -> StatusLineConfigV2:
         return StatusLineConfigV2()
 
 
-def get_effective_widgets() -> list[WidgetConfigModel]:
-    """Get final widget list with overrides applied.
+def get_enabled_widget_types() -> list[str]:
+    """Get the configured widget types in display order, minus disabled ones.
 
     Returns:
-        List of widgets with separators interleaved, ready for rendering
+        Widget type identifiers, without separators
     """
     config = load_config_file()
-    default_widgets = get_default_widgets()
 
     if config.order:
         widget_types = config.order
     else:
-        widget_types = [w.type for w in default_widgets]
+        widget_types = [w.type for w in get_default_widgets()]
+
+    return [
+        wtype
+        for wtype in widget_types
+        if config.widgets.get(wtype, WidgetOverride()).enabled
+    ]
+
+
+def get_effective_widgets() -> list[WidgetConfigModel]:
+    """Get final widget list with overrides applied.
+
+    Returns:
+        List of widgets with separators interleaved, ready for rendering
+    """
+    config = load_config_file()
+    default_widgets = get_default_widgets()
 
     widgets = []
-    for wtype in widget_types:
+    for wtype in get_enabled_widget_types():
         override = config.widgets.get(wtype, WidgetOverride())
-        if not override.enabled:
-            continue
 
         default = next((w for w in default_widgets if w.type == wtype), None)
         if default:
@@ -133,5 +143,7 @@ def save_config(config: StatusLineConfigV2) -> None:
 
     config_dict = config.model_dump(mode="python")
 
+    import yaml
+
     with open(config_path, "w", encoding="utf-8") as f:
         yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
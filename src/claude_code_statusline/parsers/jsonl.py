@@ -1,11 +1,11 @@
 """JSONL transcript parsing utilities."""
 
 import json
-import os
 
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..utils import debug
 from ..utils.debug import debug_log
 
 
@@ -41,14 +41,6 @@ class ExclusionRules:
 EXCLUSION_RULES = ExclusionRules()
 
 
-def safe_get_file_size(file_path: str) -> int:
-    """Safely get file size, returning 0 on error."""
-    try:
-        return os.path.getsize(file_path)
-    except OSError:
-        return 0
-
-
 def is_real_compact_boundary(data: dict[str, Any]) -> bool:
     """Check if this is a real compact boundary set by Claude Code.
 
@@ -58,13 +50,11 @@ def is_real_compact_boundary(data: dict[str, Any]) -> bool:
     Returns:
         True if this line is a valid compact boundary marker
     """
-    return (
-        data.get("type") == "system"
-        and data.get("subtype") == "compact_boundary"
-        and "compactMetadata" in data
-        and isinstance(data["compactMetadata"], dict)
-        and "trigger" in data["compactMetadata"]
-    )
+    if data.get("type") != "system" or data.get("subtype") != "compact_boundary":
+        return False
+
+    metadata = data.get("compactMetadata")
+    return isinstance(metadata, dict) and "trigger" in metadata
 
 
 def should_exclude_line(
@@ -114,13 +104,17 @@ def extract_message_content_chars(
     if not message:
         return 0
 
+    # Per-field sizes only feed the debug breakdown, so skip the extra
+    # json.dumps calls unless it will be logged
+    log_breakdown = detailed_debug and debug.DEBUG_ENABLED
+
     filtered_message = {}
     field_contributions = {}
 
     if "role" in message:
-        field_value = json.dumps(message["role"])
         filtered_message["role"] = message["role"]
-        field_contributions["role"] = len(field_value)
+        if log_breakdown:
+            field_contributions["role"] = len(json.dumps(message["role"]))
 
     if "content" in message:
         content = message["content"]
@@ -139,9 +133,9 @@ def extract_message_content_chars(
                 else:
                     filtered_content.append(item)
 
-        field_value = json.dumps(filtered_content)
         filtered_message["content"] = filtered_content
-        field_contributions["content"] = len(field_value)
+        if log_breakdown:
+            field_contributions["content"] = len(json.dumps(filtered_content))
 
         if images_skipped > 0:
             debug_log(
@@ -151,7 +145,7 @@ def extract_message_content_chars(
 
     total_chars = len(json.dumps(filtered_message))
 
-    if detailed_debug and field_contributions:
+    if log_breakdown and field_contributions:
         role = message.get("role", "unknown")
         debug_log(
             f"Message field breakdown ({role}): {field_contributions}", session_id
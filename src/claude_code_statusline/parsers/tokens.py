@@ -1,121 +1,512 @@
 """Real token extraction from JSONL message.usage fields."""
 
 import json
+import mmap
 import os
-import re
+import stat
+import zlib
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from ..types import TokenMetrics
 from .jsonl import is_real_compact_boundary
 
-_ISO_TZ_RE = re.compile(r"Z$")
+try:
+    import orjson
 
+    # orjson.JSONDecodeError subclasses ValueError, like json.JSONDecodeError
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
 
+try:
+    import simdjson
+
+    _HAS_SIMDJSON = True
+except ImportError:
+    _HAS_SIMDJSON = False
+
+# Below this size reading the whole file is cheaper than setting up an mmap
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+CACHE_FINGERPRINT_BYTES = 64
+
+# O_NOATIME (Linux) skips the atime update each statusline redraw would cause
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+_NOATIME_FLAG = getattr(os, "O_NOATIME", 0)
+
+
+class _Entry(NamedTuple):
+    """The fields of one transcript line that parse_transcript uses."""
+
+    session_id: str
+    slug: str
+    is_compact_boundary: bool
+    timestamp: str | None
+    context_tokens: int | None
+
+
+@lru_cache(maxsize=1024)
 def _parse_timestamp_seconds(ts: str) -> float | None:
-    """Parse ISO timestamp string to epoch seconds for duration calculation."""
+    """Parse ISO timestamp string to epoch seconds for duration calculation.
+
+    fromisoformat() accepts a trailing "Z" on Python 3.11+, so transcript
+    timestamps are parsed as-is. Cached because tool_use/tool_result pairs
+    often share a timestamp string.
+    """
     try:
-        dt = datetime.fromisoformat(_ISO_TZ_RE.sub("+00:00", ts))
-        return dt.timestamp()
+        return datetime.fromisoformat(ts).timestamp()
     except ValueError:
         return None
 
 
-def parse_transcript(
-    transcript_path: str,
-) -> tuple[TokenMetrics, int | None]:
-    """Extract token metrics and session duration in single file read.
+@contextmanager
+def _open_buffer(path: str) -> Iterator[bytes | mmap.mmap]:
+    """Open a transcript as a random-access byte buffer.
 
-    Args:
-        transcript_path: Path to the JSONL transcript file
+    Large files are memory-mapped so only the pages actually scanned are
+    read; below MMAP_THRESHOLD_BYTES the file is read in a single call.
+    """
+    try:
+        fd = os.open(path, _OPEN_FLAGS | _NOATIME_FLAG)
+    except PermissionError:
+        # O_NOATIME is only allowed on files the caller owns
+        fd = os.open(path, _OPEN_FLAGS)
+
+    with open(fd, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+            yield f.read()
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _iter_lines(
+    buf: bytes | mmap.mmap,
+    pos: int = 0,
+    end: int | None = None,
+    containing: bytes | None = None,
+) -> Iterator[tuple[int, bytes]]:
+    """Yield (start_offset, raw_line) pairs from buf[pos:end].
+
+    With containing set, lines lacking that substring are skipped by one
+    buffer search rather than being sliced out and checked individually.
+    """
+    find = buf.find
+    if end is None:
+        end = len(buf)
+    while pos < end:
+        if containing is not None:
+            hit = find(containing, pos, end)
+            if hit == -1:
+                return
+            pos = buf.rfind(b"\n", pos, hit) + 1 or pos
+        nl = find(b"\n", pos, end)
+        if nl == -1:
+            nl = end
+        yield pos, buf[pos:nl]
+        pos = nl + 1
+
+
+def _iter_lines_reverse(
+    buf: bytes | mmap.mmap, end: int | None = None, containing: bytes | None = None
+) -> Iterator[tuple[int, bytes]]:
+    """Yield (start_offset, raw_line) pairs from buf, last line first.
+
+    Lines start before end; containing behaves as in _iter_lines. Matches
+    are located with forward find(), which is several times faster than
+    rfind() over a large buffer.
+    """
+    rfind = buf.rfind
+    if end is None:
+        end = len(buf)
+
+    if containing is not None:
+        hits = []
+        hit = buf.find(containing, 0, end)
+        while hit != -1:
+            hits.append(hit)
+            hit = buf.find(containing, hit + len(containing), end)
+
+        line_start = end + 1
+        for hit in reversed(hits):
+            if hit >= line_start:
+                continue
+            line_start = rfind(b"\n", 0, hit) + 1
+            line_end = buf.find(b"\n", hit, end)
+            if line_end == -1:
+                line_end = end
+            yield line_start, buf[line_start:line_end]
+        return
+
+    while end > 0:
+        nl = rfind(b"\n", 0, end)
+        yield nl + 1, buf[nl + 1 : end]
+        end = nl
+
+
+def _project(data: Any) -> _Entry:
+    """Pull the fields parse_transcript needs out of one parsed line.
+
+    Accepts a dict or a lazy simdjson Object and returns only plain values,
+    so large message content is never materialized and no reference into a
+    reused simdjson parser outlives the call.
+    """
+    get = data.get
 
-    Returns:
-        Tuple of (TokenMetrics, duration_seconds or None)
+    line_type = get("type")
+
+    slug = ""
+    if line_type in ("user", "assistant"):
+        slug = get("slug") or ""
+
+    if line_type == "system" and get("subtype") == "compact_boundary":
+        if not isinstance(data, dict):
+            data = data.as_dict()
+        if is_real_compact_boundary(data):
+            return _Entry(get("sessionId") or "", slug, True, None, None)
+
+    context_tokens = None
+    usage = get("message", {}).get("usage")
+    if usage and not get("isSidechain", False) and not get("isApiErrorMessage", False):
+        usage_get = usage.get
+        context_tokens = (
+            usage_get("input_tokens", 0)
+            + usage_get("cache_read_input_tokens", 0)
+            + usage_get("cache_creation_input_tokens", 0)
+        )
+
+    return _Entry(get("sessionId") or "", slug, False, get("timestamp"), context_tokens)
+
+
+def _make_line_parser() -> Callable[[bytes], _Entry | None]:
+    """Return a function turning one raw JSONL line into an _Entry.
+
+    The returned function yields None for blank or malformed lines. It uses
+    simdjson's lazy parser when installed (one parser per call, reused across
+    lines), otherwise orjson or the standard library.
     """
-    if not transcript_path or not os.path.isfile(transcript_path):
-        return TokenMetrics(transcript_exists=False), None
+    if _HAS_SIMDJSON:
+        parser = simdjson.Parser()
+        loads: Callable[[bytes], Any] = parser.parse
+    else:
+        loads = _loads
+
+    def parse_line(raw: bytes) -> _Entry | None:
+        # The shortest JSON object is b"{}"; every backend skips surrounding
+        # whitespace and rejects whitespace-only input on its own
+        if len(raw) < 2:
+            return None
+        try:
+            return _project(loads(raw))
+        except ValueError:
+            return None
+
+    return parse_line
 
-    context_length = 0
 
-    most_recent_usage: dict[str, int] | None = None
+@dataclass
+class _ScanState:
+    """Transcript values as of some line, carried between invocations.
 
+    Fields mirror what parse_transcript reports: only entries after the
+    latest compact boundary feed slug, context_length and first_ts.
+    """
+
+    session_id: str = ""
+    slug: str = ""
+    had_compact_boundary: bool = False
+    context_length: int | None = None
     first_ts: float | None = None
     last_ts: float | None = None
 
-    session_id = ""
-    slug = ""
-    had_compact_boundary = False
+    def apply(self, entry: _Entry) -> None:
+        """Fold in an entry that follows everything applied so far."""
+        if entry.session_id:
+            self.session_id = entry.session_id
+
+        if not self.slug:
+            self.slug = entry.slug
+
+        if entry.is_compact_boundary:
+            self.had_compact_boundary = True
+            self.slug = ""
+            self.context_length = None
+            self.first_ts = None
+            return
+
+        if entry.timestamp:
+            ts = _parse_timestamp_seconds(entry.timestamp)
+            if ts is not None:
+                if self.first_ts is None:
+                    self.first_ts = ts
+                self.last_ts = ts
+
+        # JSONL entries are appended chronologically; last valid entry is most recent
+        if entry.context_tokens is not None:
+            self.context_length = entry.context_tokens
+
+    def to_result(self) -> tuple[TokenMetrics, int | None]:
+        """Convert to parse_transcript's return value."""
+        token_metrics = TokenMetrics(
+            context_length=self.context_length or 0,
+            transcript_exists=True,
+            session_id=self.session_id,
+            slug=self.slug,
+            had_compact_boundary=self.had_compact_boundary,
+        )
 
+        duration_seconds = None
+        if self.first_ts is not None and self.last_ts is not None:
+            duration_seconds = int(self.last_ts - self.first_ts)
+
+        return token_metrics, duration_seconds
+
+
+def _scan(
+    buf: bytes | mmap.mmap, end: int, parse_line: Callable[[bytes], _Entry | None]
+) -> _ScanState:
+    """Compute the state of buf[:end] without parsing every line.
+
+    Only entries after the last compact boundary count, and of those only
+    the newest usage/timestamp and the oldest timestamp/slug matter. So the
+    buffer is scanned backwards, fully parsing lines only until the newest
+    values are known and otherwise just looking for the boundary marker,
+    then forwards from the boundary until the oldest values are found.
+    """
+    state = _ScanState()
+
+    # Pass 1 (backwards): newest session id, timestamp and usage, then the
+    # offset just past the last compact boundary
+    active_start = 0
+    boundary_search_end = 0
+    for start, raw in _iter_lines_reverse(buf, end):
+        entry = parse_line(raw)
+        if entry is None:
+            continue
+
+        if not state.session_id:
+            state.session_id = entry.session_id
+
+        if entry.is_compact_boundary:
+            state.had_compact_boundary = True
+            active_start = start + len(raw) + 1
+            break
+
+        if state.last_ts is None and entry.timestamp:
+            state.last_ts = _parse_timestamp_seconds(entry.timestamp)
+
+        if state.context_length is None:
+            state.context_length = entry.context_tokens
+
+        if (
+            state.session_id
+            and state.last_ts is not None
+            and state.context_length is not None
+        ):
+            boundary_search_end = start
+            break
+
+    if boundary_search_end:
+        for start, raw in _iter_lines_reverse(
+            buf, boundary_search_end, containing=b"compact_boundary"
+        ):
+            entry = parse_line(raw)
+            if entry is not None and entry.is_compact_boundary:
+                state.had_compact_boundary = True
+                active_start = start + len(raw) + 1
+                break
+
+    if not state.session_id and active_start:
+        # Nothing after the boundary carried a session id; fall back to the
+        # newest one before it
+        for _, raw in _iter_lines_reverse(
+            buf, active_start - 1, containing=b'"sessionId"'
+        ):
+            entry = parse_line(raw)
+            if entry is not None and entry.session_id:
+                state.session_id = entry.session_id
+                break
+
+    # Pass 2 (forwards from the boundary): oldest timestamp and slug
+    slug_search_start = active_start
+    if state.last_ts is not None:
+        for start, raw in _iter_lines(buf, active_start, end):
+            entry = parse_line(raw)
+            if entry is None:
+                continue
+            if not state.slug:
+                state.slug = entry.slug
+            if entry.timestamp:
+                state.first_ts = _parse_timestamp_seconds(entry.timestamp)
+                if state.first_ts is not None:
+                    slug_search_start = start + len(raw) + 1
+                    break
+
+    if not state.slug:
+        for _, raw in _iter_lines(buf, slug_search_start, end, containing=b'"slug"'):
+            entry = parse_line(raw)
+            if entry is not None and entry.slug:
+                state.slug = entry.slug
+                break
+
+    return state
+
+
+@dataclass
+class _ScanCache:
+    """On-disk record of a transcript's state up to its last complete line.
+
+    head/tail hold hex snapshots of the first bytes of the file and the
+    bytes just before offset, used to detect a transcript that was
+    rewritten rather than appended to.
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+    offset: int
+    head: str
+    tail: str
+    state: _ScanState
+
+
+def _get_cache_dir() -> str:
+    """Get the directory holding per-transcript scan caches."""
+    cache_home = os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(cache_home, "claude-code-statusline", "transcripts")
+
+
+def _get_cache_path(transcript_path: str) -> str:
+    """Get the scan cache file path for a transcript."""
+    # crc32 is enough to spread files out; the stored path guards collisions
+    key = zlib.crc32(transcript_path.encode("utf-8", "surrogateescape"))
+    return os.path.join(_get_cache_dir(), f"{key:08x}.json")
+
+
+def _fingerprint(buf: bytes | mmap.mmap, offset: int) -> tuple[str, str]:
+    """Return hex snapshots of buf's start and of the bytes before offset."""
+    return (
+        buf[:CACHE_FINGERPRINT_BYTES].hex(),
+        buf[max(0, offset - CACHE_FINGERPRINT_BYTES) : offset].hex(),
+    )
+
+
+def _read_cache(cache_path: str, transcript_path: str) -> _ScanCache | None:
+    """Load a transcript scan cache, or None if missing or unusable."""
     try:
-        with open(transcript_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    data = json.loads(line)
-
-                    if data.get("sessionId"):
-                        session_id = data["sessionId"]
-
-                    if not slug:
-                        line_slug = data.get("slug")
-                        if line_slug and data.get("type") in ("user", "assistant"):
-                            slug = line_slug
-
-                    if is_real_compact_boundary(data):
-                        had_compact_boundary = True
-                        slug = ""
-                        most_recent_usage = None
-                        first_ts = None
-                        continue
-
-                    timestamp_str = data.get("timestamp")
-                    if timestamp_str:
-                        ts = _parse_timestamp_seconds(timestamp_str)
-                        if ts is not None:
-                            if first_ts is None:
-                                first_ts = ts
-                            last_ts = ts
-
-                    usage = data.get("message", {}).get("usage")
-                    if not usage:
-                        continue
-
-                    is_sidechain = data.get("isSidechain", False)
-                    is_api_error = data.get("isApiErrorMessage", False)
-
-                    # JSONL entries are appended chronologically; last valid entry is most recent
-                    if not is_sidechain and not is_api_error:
-                        most_recent_usage = usage
-
-                except (json.JSONDecodeError, ValueError):
-                    continue
+        with open(cache_path, encoding="utf-8") as f:
+            raw = json.load(f)
+        cache = _ScanCache(**{**raw, "state": _ScanState(**raw["state"])})
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    return cache if cache.path == transcript_path else None
 
+
+def _write_cache(cache_path: str, cache: _ScanCache) -> None:
+    """Atomically write a transcript scan cache, ignoring failures."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(cache), f)
+        os.replace(tmp_path, cache_path)
     except OSError:
+        pass
+
+
+def parse_transcript(
+    transcript_path: str,
+    st: os.stat_result | None = None,
+) -> tuple[TokenMetrics, int | None]:
+    """Extract token metrics and session duration from a transcript.
+
+    State up to the last complete line is cached on disk, so when Claude
+    Code has only appended to the transcript since the previous call just
+    the new lines are parsed.
+
+    Args:
+        transcript_path: Path to the JSONL transcript file
+        st: os.stat() result for transcript_path if the caller already has
+            one, saving a syscall
+
+    Returns:
+        Tuple of (TokenMetrics, duration_seconds or None)
+    """
+    if not transcript_path:
         return TokenMetrics(transcript_exists=False), None
 
-    if most_recent_usage:
-        context_length = (
-            most_recent_usage.get("input_tokens", 0)
-            + most_recent_usage.get("cache_read_input_tokens", 0)
-            + most_recent_usage.get("cache_creation_input_tokens", 0)
-        )
+    if st is None:
+        try:
+            st = os.stat(transcript_path)
+        except OSError:
+            return TokenMetrics(transcript_exists=False), None
+    if not stat.S_ISREG(st.st_mode):
+        return TokenMetrics(transcript_exists=False), None
+    if st.st_size == 0:
+        return _ScanState().to_result()
 
-    token_metrics = TokenMetrics(
-        context_length=context_length,
-        transcript_exists=True,
-        session_id=session_id,
-        slug=slug,
-        had_compact_boundary=had_compact_boundary,
-    )
+    cache_path = _get_cache_path(transcript_path)
+    cache = _read_cache(cache_path, transcript_path)
+    if (
+        cache is not None
+        and cache.mtime_ns == st.st_mtime_ns
+        and cache.size == cache.offset == st.st_size
+    ):
+        return cache.state.to_result()
+
+    parse_line = _make_line_parser()
 
-    duration_seconds = None
-    if first_ts is not None and last_ts is not None:
-        duration_seconds = int(last_ts - first_ts)
+    try:
+        with _open_buffer(transcript_path) as buf:
+            size = len(buf)
+            complete_end = buf.rfind(b"\n") + 1
+
+            if (
+                cache is not None
+                and cache.offset <= complete_end
+                and (cache.head, cache.tail) == _fingerprint(buf, cache.offset)
+            ):
+                state = cache.state
+                for _, raw in _iter_lines(buf, cache.offset, complete_end):
+                    entry = parse_line(raw)
+                    if entry is not None:
+                        state.apply(entry)
+            else:
+                state = _scan(buf, complete_end, parse_line)
+
+            head, tail = _fingerprint(buf, complete_end)
+            _write_cache(
+                cache_path,
+                _ScanCache(
+                    path=transcript_path,
+                    mtime_ns=st.st_mtime_ns,
+                    size=size,
+                    offset=complete_end,
+                    head=head,
+                    tail=tail,
+                    state=state,
+                ),
+            )
+
+            # A trailing line without a newline may still be mid-write, so it
+            # counts for this call but is re-read next time
+            if complete_end < size:
+                entry = parse_line(buf[complete_end:size])
+                if entry is not None:
+                    state = replace(state)
+                    state.apply(entry)
+
+    except (OSError, ValueError):
+        return TokenMetrics(transcript_exists=False), None
 
-    return token_metrics, duration_seconds
+    return state.to_result()
 
 
 def format_duration(duration_seconds: int) -> str:
@@ -1,5 +1,7 @@
 """Main rendering pipeline for status line."""
 
+from collections.abc import Callable
+
 from .config.loader import get_effective_widgets
 from .config.schema import WidgetConfigModel
 from .types import RenderContext
@@ -8,59 +10,111 @@ from .utils.models import get_context_limit_for_render, get_current_context_leng
 from .widgets import builtin  # noqa: F401
 from .widgets.registry import get_widget
 
+RenderFn = Callable[[RenderContext], str | None]
 
-def _resolve_auto_color(widget_type: str, context: RenderContext) -> str:
-    """Resolve 'auto' color based on widget type and context.
 
-    Args:
-        widget_type: Widget type identifier
-        context: Render context with data
+def _auto_context_color(context: RenderContext) -> str:
+    """Color context widgets by how full the context window is."""
+    if (
+        context.context_window is not None
+        and context.context_window.used_percentage is not None
+    ):
+        return get_usage_color(context.context_window.used_percentage)
 
-    Returns:
-        Resolved color name
-    """
-    if widget_type in ("context-percentage", "context-tokens"):
-        if (
-            context.context_window is not None
-            and context.context_window.used_percentage is not None
-        ):
-            return get_usage_color(context.context_window.used_percentage)
+    context_limit = get_context_limit_for_render(context)
+    context_length = get_current_context_length(context)
 
-        context_limit = get_context_limit_for_render(context)
-        context_length = get_current_context_length(context)
+    if context_length > 0 and context_limit > 0:
+        percentage = (context_length * 100) / context_limit
+        return get_usage_color(percentage)
 
-        if context_length > 0 and context_limit > 0:
-            percentage = (context_length * 100) / context_limit
-            return get_usage_color(percentage)
+    return "white"
 
-    if widget_type == "cost":
-        cost = context.data.get("cost") or {}
-        total_cost = cost.get("total_cost_usd", 0)
-        return get_cost_color(total_cost)
 
-    return "white"
+def _auto_cost_color(context: RenderContext) -> str:
+    """Color the cost widget by total session cost."""
+    total_cost = context.cost.get("total_cost_usd", 0)
+    return get_cost_color(total_cost)
 
 
-def _apply_color(
-    content: str, widget_config: WidgetConfigModel, context: RenderContext
-) -> str:
-    """Apply color to rendered widget content."""
+_AUTO_RESOLVERS: dict[str, Callable[[RenderContext], str]] = {
+    "context-percentage": _auto_context_color,
+    "context-tokens": _auto_context_color,
+    "cost": _auto_cost_color,
+}
+
+
+def _compile_widget(
+    widget_config: WidgetConfigModel, compact: bool = False
+) -> RenderFn:
+    """Build a render function with the widget and its color pre-resolved.
+
+    The registry lookup, bound render method, fallback text and color mode
+    are fixed once here, and the returned closure is specialized for that
+    mode, so rendering only branches on color for widgets whose "auto"
+    color depends on runtime data.
+
+    Args:
+        widget_config: Widget configuration
+        compact: Use the widget's compact representation
+
+    Returns:
+        Function rendering the colorized widget for a context, or None to skip
+    """
     widget = get_widget(widget_config.type)
     if not widget:
-        return content
+        return lambda context: None
 
+    render = widget.render_compact if compact else widget.render
+    fallback_text = widget.fallback_text
+    bold = widget_config.bold
     color = widget_config.color
-    if color == "auto":
-        color = _resolve_auto_color(widget_config.type, context)
-    elif color is None:
+    if color is None:
         color = widget.default_color
-        if color == "auto":
-            color = _resolve_auto_color(widget_config.type, context)
 
     if color == "none":
-        return content
 
-    return colorize(content, color, widget_config.bold)
+        def render_plain(context: RenderContext) -> str | None:
+            content = render(widget_config, context)
+            return fallback_text if content is None else content
+
+        return render_plain
+
+    if color == "auto":
+        auto_resolver = _AUTO_RESOLVERS.get(widget_config.type)
+        if auto_resolver is None:
+            color = "white"
+        else:
+            resolve = auto_resolver
+
+            def render_auto(context: RenderContext) -> str | None:
+                content = render(widget_config, context)
+                if content is None:
+                    if fallback_text is None:
+                        return None
+                    content = fallback_text
+                return colorize(content, resolve(context), bold)
+
+            return render_auto
+
+    static_color = color
+
+    def render_static(context: RenderContext) -> str | None:
+        content = render(widget_config, context)
+        if content is None:
+            if fallback_text is None:
+                return None
+            content = fallback_text
+        return colorize(content, static_color, bold)
+
+    return render_static
+
+
+def _compile_pipeline(
+    widgets: list[WidgetConfigModel], compact: bool = False
+) -> list[tuple[WidgetConfigModel, RenderFn]]:
+    """Compile each widget config into a (config, render function) pair."""
+    return [(cfg, _compile_widget(cfg, compact)) for cfg in widgets]
 
 
 def render_widget(
@@ -75,38 +129,14 @@ def render_widget(
     Returns:
         Rendered and colorized widget string, or None to skip
     """
-    widget = get_widget(widget_config.type)
-    if not widget:
-        return None
-
-    content = widget.render(widget_config, context)
-
-    if content is None:
-        if widget.fallback_text is not None:
-            content = widget.fallback_text
-        else:
-            return None
-
-    return _apply_color(content, widget_config, context)
+    return _compile_widget(widget_config)(context)
 
 
 def render_widget_compact(
     widget_config: WidgetConfigModel, context: RenderContext
 ) -> str | None:
     """Render a widget in compact mode with colors applied."""
-    widget = get_widget(widget_config.type)
-    if not widget:
-        return None
-
-    content = widget.render_compact(widget_config, context)
-
-    if content is None:
-        if widget.fallback_text is not None:
-            content = widget.fallback_text
-        else:
-            return None
-
-    return _apply_color(content, widget_config, context)
+    return _compile_widget(widget_config, compact=True)(context)
 
 
 def _remove_orphaned_separators(
@@ -125,26 +155,26 @@ def _remove_orphaned_separators(
     Returns:
         List of rendered strings with orphaned separators removed
     """
-    rendered = [(cfg, s) for cfg, s in pairs if s is not None]
-
-    result = []
+    result: list[str] = []
+    pending_separator: str | None = None
     prev_was_separator = True
 
-    for cfg, content in rendered:
-        is_separator = cfg.type == "separator"
+    for cfg, content in pairs:
+        if content is None:
+            continue
 
-        if is_separator:
+        if cfg.type == "separator":
             if not prev_was_separator:
-                result.append((cfg, content))
+                pending_separator = content
             prev_was_separator = True
         else:
-            result.append((cfg, content))
+            if pending_separator is not None:
+                result.append(pending_separator)
+                pending_separator = None
+            result.append(content)
             prev_was_separator = False
 
-    if result and result[-1][0].type == "separator":
-        result.pop()
-
-    return [content for _, content in result]
+    return result
 
 
 def _render_line(
@@ -232,10 +262,7 @@ def render_status_line(widgets: list[WidgetConfigModel], context: RenderContext)
     if not widgets:
         return ""
 
-    rendered_pairs = []
-    for widget_config in widgets:
-        widget_str = render_widget(widget_config, context)
-        rendered_pairs.append((widget_config, widget_str))
+    rendered_pairs = [(cfg, fn(context)) for cfg, fn in _compile_pipeline(widgets)]
 
     final_widgets = _remove_orphaned_separators(rendered_pairs)
 
@@ -258,7 +285,7 @@ def render_status_line_width_aware(
     """
     # Step 1: full render
     full_pairs: list[tuple[WidgetConfigModel, str | None]] = [
-        (cfg, render_widget(cfg, context)) for cfg in widgets
+        (cfg, fn(context)) for cfg, fn in _compile_pipeline(widgets)
     ]
     full_line = _render_line(full_pairs)
     if visible_len(full_line) <= terminal_width:
@@ -266,7 +293,7 @@ def render_status_line_width_aware(
 
     # Step 2: compact render
     compact_pairs: list[tuple[WidgetConfigModel, str | None]] = [
-        (cfg, render_widget_compact(cfg, context)) for cfg in widgets
+        (cfg, fn(context)) for cfg, fn in _compile_pipeline(widgets, compact=True)
     ]
     compact_line = _render_line(compact_pairs)
     if visible_len(compact_line) <= terminal_width:
@@ -285,10 +312,9 @@ def render_status_line_width_aware(
     for to_drop in drop_order:
         dropped.add(to_drop.id)
 
+        # Rendering depends only on the context, so reuse the compact pass
         remaining_pairs = [
-            (cfg, render_widget_compact(cfg, context))
-            for cfg in widgets
-            if cfg.id not in dropped
+            (cfg, rendered) for cfg, rendered in compact_pairs if cfg.id not in dropped
         ]
 
         # Try single line first
@@ -304,7 +330,7 @@ def render_status_line_width_aware(
     # Floor: return highest-priority widget alone (best effort)
     if content_widgets:
         best = min(content_widgets, key=_get_widget_priority)
-        return _render_line([(best, render_widget_compact(best, context))])
+        return _render_line([next(pair for pair in compact_pairs if pair[0] is best)])
     return ""
 
 
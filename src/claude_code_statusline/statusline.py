@@ -1,21 +1,33 @@
 #!/usr/bin/env python3
 
-import argparse
 import json
 import os
+import stat
 import sys
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, cast
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, cast
 
-from .config.loader import load_config_file
+from .config.loader import get_enabled_widget_types, load_config_file
 from .parsers.tokens import parse_transcript
 from .renderer import render_status_line_with_config
 from .types import ContextWindow, RenderContext, TokenMetrics
+from .utils import debug
 from .utils.debug import debug_log
-from .utils.git import get_git_status
-from .utils.models import prefetch_model_data
+from .utils.git import get_git_status, start_git_status_prefetch
+from .utils.models import start_model_data_prefetch
 from .utils.terminal import detect_terminal_width, set_terminal_title
+from .widgets.registry import any_widget_uses_git
+
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import orjson
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 
 def parse_input_data() -> dict[str, Any]:
@@ -25,24 +37,38 @@ def parse_input_data() -> dict[str, Any]:
         Dictionary with Claude Code JSON payload
     """
     try:
-        input_data = sys.stdin.read()
-        return cast(dict[str, Any], json.loads(input_data))
-    except (json.JSONDecodeError, ValueError):
+        # Raw bytes skip the text-mode decoding layer; both orjson and json
+        # take UTF-8 bytes directly, and no reference to the buffer outlives
+        # the parse
+        return cast(dict[str, Any], _loads(sys.stdin.buffer.read()))
+    except (OSError, ValueError):
         return {}
 
 
-def find_transcript_path(data: dict[str, Any]) -> str:
+def _stat_file(path: str) -> os.stat_result | None:
+    """Return os.stat(path) if path is a regular file, else None."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def find_transcript_path(data: dict[str, Any]) -> tuple[str, os.stat_result | None]:
     """Find transcript path, with fallback to construct from session_id.
 
     Args:
         data: JSON input data
 
     Returns:
-        Path to transcript file, or empty string if not found
+        Tuple of (transcript path or empty string, its stat result or None
+        if it is not an existing file)
     """
     transcript_path: str = data.get("transcript_path", "")
-    if transcript_path and os.path.isfile(transcript_path):
-        return transcript_path
+    if transcript_path:
+        st = _stat_file(transcript_path)
+        if st is not None:
+            return transcript_path, st
 
     session_id = data.get("session_id", "")
     workspace = (data.get("workspace") or {}).get("current_dir", "")
@@ -55,10 +81,11 @@ def find_transcript_path(data: dict[str, Any]) -> str:
         potential_path = os.path.expanduser(
             f"~/.claude/projects/-{encoded_path}/{session_id}.jsonl"
         )
-        if os.path.isfile(potential_path):
-            return potential_path
+        st = _stat_file(potential_path)
+        if st is not None:
+            return potential_path, st
 
-    return transcript_path
+    return transcript_path, None
 
 
 def extract_session_id(data: dict[str, Any], transcript_path: str) -> str:
@@ -154,12 +181,14 @@ def resolve_terminal_title(
     return ""
 
 
-def create_argument_parser() -> argparse.ArgumentParser:
+def create_argument_parser() -> "argparse.ArgumentParser":
     """Create the CLI argument parser with subcommands.
 
     Returns:
         Configured argument parser
     """
+    import argparse
+
     from . import __version__
 
     parser = argparse.ArgumentParser(
@@ -201,26 +230,30 @@ def create_argument_parser() -> argparse.ArgumentParser:
 
 
 def main() -> None:
-    """Main entry point with widget-based rendering and parallel I/O."""
-    parser = create_argument_parser()
-    args = parser.parse_args()
-
-    if args.command == "install":
+    """Main entry point with widget-based rendering and background model prefetch."""
+    # Claude Code runs the statusline with no arguments on every redraw, so
+    # argparse is only imported when there is something to parse
+    command = None
+    if len(sys.argv) > 1:
+        args = create_argument_parser().parse_args()
+        command = args.command
+
+    if command == "install":
         from .cli.commands import cmd_install
 
         sys.exit(cmd_install(force=args.yes))
-    elif args.command == "uninstall":
+    elif command == "uninstall":
         from .cli.commands import cmd_uninstall
 
         sys.exit(cmd_uninstall())
-    elif args.command == "doctor":
+    elif command == "doctor":
         from .cli.commands import cmd_doctor
 
         sys.exit(cmd_doctor())
 
     data = parse_input_data()
 
-    transcript_path = find_transcript_path(data)
+    transcript_path, transcript_stat = find_transcript_path(data)
 
     session_id = extract_session_id(data, transcript_path)
 
@@ -229,21 +262,28 @@ def main() -> None:
 
     context_window = extract_context_window(data)
 
-    debug_log("=== SESSION START ===", session_id)
-    debug_log(
-        f"Working Directory: {(data.get('workspace') or {}).get('current_dir', '')}",
-        session_id,
-    )
-    debug_log(f"Model ID: {(data.get('model') or {}).get('id', '')}", session_id)
-    debug_log(f"Transcript Path: {transcript_path}", session_id)
-    debug_log(f"Context window from payload: {context_window is not None}", session_id)
+    if debug.DEBUG_ENABLED:
+        debug_log("=== SESSION START ===", session_id)
+        debug_log(
+            f"Working Directory: {(data.get('workspace') or {}).get('current_dir', '')}",
+            session_id,
+        )
+        debug_log(f"Model ID: {(data.get('model') or {}).get('id', '')}", session_id)
+        debug_log(f"Transcript Path: {transcript_path}", session_id)
+        debug_log(
+            f"Context window from payload: {context_window is not None}", session_id
+        )
+
+    if not context_window or context_window.context_window_size == 0:
+        start_model_data_prefetch()
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        transcript_future = executor.submit(parse_transcript, transcript_path)
-        if not context_window or context_window.context_window_size == 0:
-            executor.submit(prefetch_model_data)
+    workspace = (data.get("workspace") or {}).get("current_dir", "")
+    if workspace and any_widget_uses_git(get_enabled_widget_types()):
+        start_git_status_prefetch(workspace)
 
-        token_metrics, transcript_duration = transcript_future.result()
+    token_metrics, transcript_duration = parse_transcript(
+        transcript_path, transcript_stat
+    )
 
     if token_metrics.had_compact_boundary and token_metrics.session_id:
         data["session_id"] = token_metrics.session_id
@@ -261,9 +301,10 @@ def main() -> None:
         terminal_width=terminal_width,
     )
 
-    debug_log(f"Token metrics: {token_metrics}", session_id)
-    debug_log(f"Duration seconds: {duration_seconds}", session_id)
-    debug_log("=" * 25, session_id)
+    if debug.DEBUG_ENABLED:
+        debug_log(f"Token metrics: {token_metrics}", session_id)
+        debug_log(f"Duration seconds: {duration_seconds}", session_id)
+        debug_log("=" * 25, session_id)
 
     output = render_status_line_with_config(context)
 
@@ -273,7 +314,9 @@ def main() -> None:
         if title:
             set_terminal_title(title)
 
-    print(output, end="")
+    # Encode once and bypass the text layer; the line is written in one call
+    sys.stdout.buffer.write(output.encode("utf-8", "replace"))
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
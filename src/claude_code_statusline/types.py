@@ -1,10 +1,10 @@
 """Data types for Claude Code Status Line."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenMetrics:
     """Token usage extracted from JSONL message.usage fields."""
 
@@ -15,7 +15,7 @@ class TokenMetrics:
     had_compact_boundary: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GitStatus:
     """Git repository status information."""
 
@@ -27,7 +27,7 @@ class GitStatus:
     is_git_repo: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextWindow:
     """Context window data from Claude Code status payload."""
 
@@ -57,7 +57,7 @@ class ContextWindow:
         return self.current_input_tokens is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderContext:
     """Context passed to widgets during rendering."""
 
@@ -67,3 +67,21 @@ class RenderContext:
     duration_seconds: int | None = None
     terminal_width: int | None = None
     context_window: ContextWindow | None = None
+    # Memoized by get_context_limit_for_render; several widgets ask per render
+    context_limit: int | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def cost(self) -> dict[str, Any]:
+        """The payload's cost section, or an empty dict."""
+        return self.data.get("cost") or {}
+
+    @property
+    def model(self) -> dict[str, Any]:
+        """The payload's model section, or an empty dict."""
+        return self.data.get("model") or {}
+
+    @property
+    def cwd(self) -> str | None:
+        """The workspace's current directory, if reported."""
+        workspace = self.data.get("workspace") or {}
+        return workspace.get("current_dir")
@@ -2,6 +2,8 @@
 
 import re
 
+from functools import lru_cache
+
 # Matches SGR (Select Graphic Rendition) sequences only — the only ANSI
 # escape sequences this codebase emits (colors, bold, dim, reset).
 _ANSI_SGR_RE = re.compile(r"\x1b\[[0-9;]*m")
@@ -31,12 +33,15 @@ COLORS = {
 COLORS["gray"] = COLORS["bright_black"]
 COLORS["grey"] = COLORS["bright_black"]
 
+_RESET = COLORS["reset"]
+
 
 def visible_len(text: str) -> int:
     """Return the visible length of text, excluding ANSI escape sequences."""
     return len(_ANSI_SGR_RE.sub("", text))
 
 
+@lru_cache(maxsize=64)
 def get_color_code(color_name: str | None) -> str:
     """Get ANSI color code by name.
 
@@ -62,12 +67,19 @@ def colorize(text: str, color: str | None = None, bold: bool = False) -> str:
     Returns:
         Colorized text with ANSI codes
     """
-    if not text:
+    if not text or color == "none":
         return text
 
-    if color == "none":
+    prefix = _sgr_prefix(color, bold)
+    if not prefix:
         return text
 
+    return f"{prefix}{text}{_RESET}"
+
+
+@lru_cache(maxsize=64)
+def _sgr_prefix(color: str | None, bold: bool) -> str:
+    """Return the escape codes colorize() places before text."""
     codes = []
     if bold:
         codes.append(COLORS["bold"])
@@ -75,11 +87,7 @@ def colorize(text: str, color: str | None = None, bold: bool = False) -> str:
         color_code = get_color_code(color)
         if color_code:
             codes.append(color_code)
-
-    if not codes:
-        return text
-
-    return "".join(codes) + text + COLORS["reset"]
+    return "".join(codes)
 
 
 def get_usage_color(percentage: float) -> str:
@@ -1,21 +1,24 @@
 """Debug logging utilities."""
 
+import atexit
 import os
 import sys
 import time
 
+from functools import lru_cache
+from typing import TextIO
 
-def debug_log(message: str, session_id: str = "", transcript_path: str = "") -> None:
-    """Log debug messages to per-session debug log files if debug mode is enabled.
+# Read once: the environment does not change during a statusline run
+DEBUG_ENABLED = bool(os.getenv("CLAUDE_CODE_STATUSLINE_DEBUG"))
 
-    Args:
-        message: Debug message to log
-        session_id: Optional session identifier
-        transcript_path: Optional path to transcript (used to extract session ID)
-    """
-    if not os.getenv("CLAUDE_CODE_STATUSLINE_DEBUG"):
-        return
+_LOGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "logs")
+
+_log_files: dict[str, TextIO] = {}
 
+
+@lru_cache(maxsize=32)
+def _get_log_file(session_id: str, transcript_path: str) -> str:
+    """Get the log file path for a session, resolved once per argument pair."""
     effective_session_id = session_id
 
     if not effective_session_id and transcript_path:
@@ -26,17 +29,46 @@ def debug_log(message: str, session_id: str = "", transcript_path: str = "") ->
     if not effective_session_id:
         effective_session_id = "unknown"
 
-    logs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "logs")
-    log_file = os.path.join(logs_dir, f"statusline_debug_{effective_session_id}.log")
+    return os.path.join(_LOGS_DIR, f"statusline_debug_{effective_session_id}.log")
+
+
+def _close_log_files() -> None:
+    """Flush and close the log files opened by debug_log."""
+    for f in _log_files.values():
+        try:
+            f.close()
+        except OSError:
+            pass
+    _log_files.clear()
+
+
+def debug_log(message: str, session_id: str = "", transcript_path: str = "") -> None:
+    """Log debug messages to per-session debug log files if debug mode is enabled.
+
+    Args:
+        message: Debug message to log
+        session_id: Optional session identifier
+        transcript_path: Optional path to transcript (used to extract session ID)
+    """
+    if not DEBUG_ENABLED:
+        return
+
+    log_file = _get_log_file(session_id, transcript_path)
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
     session_prefix = f"[{session_id}] " if session_id else ""
     log_message = f"[{timestamp}] {session_prefix}{message}\n"
 
     try:
-        os.makedirs(logs_dir, exist_ok=True)
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(log_message)
+        f = _log_files.get(log_file)
+        if f is None:
+            os.makedirs(_LOGS_DIR, exist_ok=True)
+            # Block buffered; _close_log_files flushes everything at exit
+            f = open(log_file, "a", encoding="utf-8")
+            if not _log_files:
+                atexit.register(_close_log_files)
+            _log_files[log_file] = f
+        f.write(log_message)
     except OSError:
         print(
             f"DEBUG (couldn't write to {log_file}): {session_prefix}{message}",
@@ -1,9 +1,14 @@
 """Formatting utilities for numbers and progress bars."""
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=32, typed=True)
 def format_number(num: int, decimals: int = 0) -> str:
     """Format a number with K/M suffix.
 
+    Cached since context limits are formatted by several widgets per render.
+
     Args:
         num: Number to format
         decimals: Number of decimal places for K/M formatting
@@ -14,17 +19,26 @@ def format_number(num: int, decimals: int = 0) -> str:
     if num < 1000:
         return str(num)
     elif num < 1_000_000:
-        k = num / 1000
         if decimals == 0:
-            return f"{round(k)}K"
+            return f"{_div_round(num, 1000)}K"
+        k = num / 1000
         return f"{k:.{decimals}f}K".rstrip("0").rstrip(".")
     else:
-        m = num / 1_000_000
         if decimals == 0:
-            return f"{round(m)}M"
+            return f"{_div_round(num, 1_000_000)}M"
+        m = num / 1_000_000
         return f"{m:.{decimals}f}M".rstrip("0").rstrip(".")
 
 
+def _div_round(num: int, divisor: int) -> int:
+    """Integer equivalent of round(num / divisor), ties to even."""
+    quotient, remainder = divmod(num, divisor)
+    twice = remainder * 2
+    if twice > divisor or (twice == divisor and quotient % 2):
+        quotient += 1
+    return quotient
+
+
 def render_progress_bar(
     percentage: float, segments: int = 10, filled_char: str = "●", empty_char: str = "○"
 ) -> str:
@@ -40,8 +54,13 @@ def render_progress_bar(
         Progress bar string (e.g., "●●●●●●○○○○")
     """
     filled = int((percentage / 100) * segments)
-    empty = segments - filled
-    return filled_char * filled + empty_char * empty
+    return _progress_bar(filled, segments, filled_char, empty_char)
+
+
+@lru_cache(maxsize=64)
+def _progress_bar(filled: int, segments: int, filled_char: str, empty_char: str) -> str:
+    """Build a bar with filled segments; only a few distinct bars ever occur."""
+    return filled_char * filled + empty_char * (segments - filled)
 
 
 def format_percentage(percentage: float, decimals: int = 1) -> str:
@@ -1,16 +1,20 @@
 """Git command execution utilities."""
 
-import re
-import subprocess
+import json
+import os
+import threading
 import time
+import zlib
 
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 
 from ..types import GitStatus
 
 _git_cache: tuple[float, str | None, GitStatus] | None = None
 GIT_CACHE_TTL = 2.0  # seconds
 
+_prefetch_thread: threading.Thread | None = None
+
 
 def _run_git(args: list[str], cwd: str | None = None) -> str | None:
     """Run git command and return stdout, or None on error.
@@ -22,22 +26,123 @@ def _run_git(args: list[str], cwd: str | None = None) -> str | None:
     Returns:
         Command stdout or None if command failed
     """
+    return _run_git_many([args], cwd)[0]
+
+
+def _run_git_many(
+    commands: list[list[str]], cwd: str | None = None
+) -> list[str | None]:
+    """Run several git commands concurrently, like _run_git for each.
+
+    All processes are started before any is waited on, so they overlap
+    without needing a thread per command.
+
+    Args:
+        commands: Argument lists, one per git invocation
+        cwd: Working directory for the git commands
+
+    Returns:
+        Stripped stdout per command, or None where a command failed
+    """
+    import subprocess
+
+    procs: list[subprocess.Popen[str] | None] = []
+    for args in commands:
+        try:
+            procs.append(
+                subprocess.Popen(
+                    ["git"] + args,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    cwd=cwd,
+                )
+            )
+        except OSError:
+            procs.append(None)
+
+    deadline = time.monotonic() + 5
+    results: list[str | None] = []
+    for proc in procs:
+        if proc is None:
+            results.append(None)
+            continue
+        try:
+            stdout, _ = proc.communicate(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            results.append(None)
+            continue
+        results.append(stdout.strip() if proc.returncode == 0 else None)
+
+    return results
+
+
+def _get_cache_path(cwd: str) -> str:
+    """Get the on-disk git status cache file path for a directory."""
+    cache_home = os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    # crc32 is enough to spread files out; the stored cwd guards collisions
+    key = zlib.crc32(cwd.encode("utf-8", "surrogateescape"))
+    return os.path.join(cache_home, "claude-code-statusline", "git", f"{key:08x}.json")
+
+
+def _repo_fingerprint(cwd: str) -> list[int]:
+    """Get mtimes of .git/HEAD and .git/index under cwd, 0 where missing.
+
+    Catches commits, checkouts and staging done within the TTL when cwd is
+    the repository root; elsewhere the TTL alone bounds staleness.
+    """
+    fingerprint = []
+    for name in ("HEAD", "index"):
+        try:
+            fingerprint.append(os.stat(os.path.join(cwd, ".git", name)).st_mtime_ns)
+        except OSError:
+            fingerprint.append(0)
+    return fingerprint
+
+
+def _read_disk_cache(cwd: str, fingerprint: list[int]) -> GitStatus | None:
+    """Load a git status cached by a recent invocation, or None."""
     try:
-        result = subprocess.run(
-            ["git"] + args,
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=cwd,
-        )
-        return result.stdout.strip() if result.returncode == 0 else None
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        with open(_get_cache_path(cwd), encoding="utf-8") as f:
+            raw = json.load(f)
+        if raw["cwd"] != cwd or raw["fingerprint"] != fingerprint:
+            return None
+        if not 0 <= time.time() - raw["time"] < GIT_CACHE_TTL:
+            return None
+        return GitStatus(**raw["status"])
+    except (OSError, ValueError, TypeError, KeyError):
         return None
 
 
+def _write_disk_cache(cwd: str, fingerprint: list[int], status: GitStatus) -> None:
+    """Atomically write the git status cache, ignoring failures."""
+    cache_path = _get_cache_path(cwd)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "cwd": cwd,
+                    "time": time.time(),
+                    "fingerprint": fingerprint,
+                    "status": asdict(status),
+                },
+                f,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def get_git_status(cwd: str | None = None) -> GitStatus:
     """Get comprehensive git repository status with 2-second TTL cache.
 
+    Each statusline run is a new process, so for an explicit cwd the cache
+    is also kept on disk and shared between invocations.
+
     Args:
         cwd: Working directory to check git status in
 
@@ -46,6 +151,13 @@ def get_git_status(cwd: str | None = None) -> GitStatus:
     """
     global _git_cache
 
+    # A prefetch for the same cwd leaves its result in _git_cache
+    if (
+        _prefetch_thread is not None
+        and _prefetch_thread is not threading.current_thread()
+    ):
+        _prefetch_thread.join()
+
     now = time.monotonic()
 
     if _git_cache is not None:
@@ -53,24 +165,48 @@ def get_git_status(cwd: str | None = None) -> GitStatus:
         if cache_cwd == cwd and (now - cache_time) < GIT_CACHE_TTL:
             return cached_status
 
-    git_dir = _run_git(["rev-parse", "--git-dir"], cwd=cwd)
-    if git_dir is None:
-        status = GitStatus(is_git_repo=False)
-        _git_cache = (now, cwd, status)
-        return status
-
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        branch_future = executor.submit(_run_git, ["branch", "--show-current"], cwd)
-        unstaged_future = executor.submit(_run_git, ["diff", "--shortstat"], cwd)
-        staged_future = executor.submit(
-            _run_git, ["diff", "--cached", "--shortstat"], cwd
-        )
-        worktree_future = executor.submit(_run_git, ["worktree", "list"], cwd)
-
-        branch = branch_future.result()
-        unstaged = unstaged_future.result()
-        staged = staged_future.result()
-        worktree_list = worktree_future.result()
+    status = _get_git_status_cached_on_disk(cwd) if cwd else _compute_git_status(cwd)
+    _git_cache = (now, cwd, status)
+    return status
+
+
+def start_git_status_prefetch(cwd: str) -> None:
+    """Run get_git_status(cwd) on a daemon thread.
+
+    Lets the git processes run while the transcript is parsed; a later
+    get_git_status call waits for the thread instead of querying again.
+    """
+    global _prefetch_thread
+    _prefetch_thread = threading.Thread(target=get_git_status, args=(cwd,), daemon=True)
+    _prefetch_thread.start()
+
+
+def _get_git_status_cached_on_disk(cwd: str) -> GitStatus:
+    """Return the disk-cached status for cwd, recomputing it on a miss."""
+    fingerprint = _repo_fingerprint(cwd)
+    status = _read_disk_cache(cwd, fingerprint)
+    if status is None:
+        status = _compute_git_status(cwd)
+        _write_disk_cache(cwd, fingerprint, status)
+    return status
+
+
+def _compute_git_status(cwd: str | None) -> GitStatus:
+    """Query git for the status of cwd."""
+    # Doubles as the repository check: it only fails outside a repo, and
+    # prints an empty line for a detached HEAD
+    branch = _run_git(["branch", "--show-current"], cwd=cwd)
+    if branch is None:
+        return GitStatus(is_git_repo=False)
+
+    unstaged, staged, worktree_list = _run_git_many(
+        [
+            ["diff", "--shortstat"],
+            ["diff", "--cached", "--shortstat"],
+            ["worktree", "list"],
+        ],
+        cwd,
+    )
 
     insertions = 0
     deletions = 0
@@ -103,7 +239,7 @@ def get_git_status(cwd: str | None = None) -> GitStatus:
                         worktree = worktree_path.split("/")[-1]
                         break
 
-    status = GitStatus(
+    return GitStatus(
         branch=branch,
         insertions=insertions,
         deletions=deletions,
@@ -112,17 +248,22 @@ def get_git_status(cwd: str | None = None) -> GitStatus:
         is_git_repo=True,
     )
 
-    _git_cache = (now, cwd, status)
-    return status
+
+def _parse_shortstat_count(stat_output: str, label: str) -> int:
+    """Parse the count preceding label in git diff --shortstat output."""
+    end = stat_output.find(label)
+    if end == -1:
+        return 0
+    start = stat_output.rfind(" ", 0, end) + 1
+    count = stat_output[start:end]
+    return int(count) if count.isdigit() else 0
 
 
 def _parse_insertions(stat_output: str) -> int:
     """Parse insertions from git diff --shortstat output."""
-    match = re.search(r"(\d+) insertion", stat_output)
-    return int(match.group(1)) if match else 0
+    return _parse_shortstat_count(stat_output, " insertion")
 
 
 def _parse_deletions(stat_output: str) -> int:
     """Parse deletions from git diff --shortstat output."""
-    match = re.search(r"(\d+) deletion", stat_output)
-    return int(match.group(1)) if match else 0
+    return _parse_shortstat_count(stat_output, " deletion")
@@ -5,16 +5,15 @@ import os
 import tempfile
 import threading
 import time
-import urllib.error
-import urllib.request
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, cast
 
 from ..types import RenderContext
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelInfo:
     """Information about a specific model."""
 
@@ -25,6 +24,10 @@ class ModelInfo:
 CACHE_FILE_NAME = "claude_code_model_data_cache.json"
 CACHE_FILE = os.path.join(tempfile.gettempdir(), CACHE_FILE_NAME)
 CACHE_TTL_SECONDS = 604800  # 1 week (7 days)
+# Longest an unknown-model lookup waits on the API before using stale data
+FETCH_WAIT_SECONDS = 0.05
+REFRESH_MARKER_FILE = CACHE_FILE + ".refreshing"
+REFRESH_RETRY_SECONDS = 300
 
 MODEL_INFO: dict[str, ModelInfo] = {
     "default": ModelInfo("Unknown Model", 200000),
@@ -50,6 +53,28 @@ MODEL_INFO: dict[str, ModelInfo] = {
     "gpt-5": ModelInfo("GPT-5", 400000),
 }
 
+_DEFAULT_CONTEXT_LIMIT = MODEL_INFO["default"].context_limit
+
+# Longest first, so the most specific substring match wins
+_MODEL_INFO_KEYS_BY_LEN = tuple(
+    key for key in sorted(MODEL_INFO, key=len, reverse=True) if key != "default"
+)
+
+_api_keys_by_len: tuple[dict[str, Any], list[tuple[str, str]]] | None = None
+
+
+def _get_api_keys_by_len(api_data: dict[str, Any]) -> list[tuple[str, str]]:
+    """Get (key, lowercased key) pairs of api_data, longest first.
+
+    Remembered for the last dict seen, which is the prefetched data for the
+    rest of the process.
+    """
+    global _api_keys_by_len
+    if _api_keys_by_len is None or _api_keys_by_len[0] is not api_data:
+        keys = [(key, key.lower()) for key in sorted(api_data, key=len, reverse=True)]
+        _api_keys_by_len = (api_data, keys)
+    return _api_keys_by_len[1]
+
 
 def extract_token_limit(model_info: dict[str, Any]) -> int | None:
     """Extract token limit from model info dictionary."""
@@ -57,27 +82,42 @@ def extract_token_limit(model_info: dict[str, Any]) -> int | None:
     return int(limit) if limit else None
 
 
-def get_cached_or_fetch_data() -> dict[str, Any] | None:
-    """Get model data from cache or fetch from API if cache is expired or does not exist."""
+def _read_cache_file(max_age: float | None = None) -> dict[str, Any] | None:
+    """Read the model data cache, or None if missing, unreadable or too old.
+
+    Args:
+        max_age: Maximum cache age in seconds, or None to accept any age
+    """
     try:
-        if os.path.exists(CACHE_FILE):
-            cache_age = time.time() - os.path.getmtime(CACHE_FILE)
-            if cache_age <= CACHE_TTL_SECONDS:
-                with open(CACHE_FILE) as f:
-                    return cast(dict[str, Any], json.load(f))
+        with open(CACHE_FILE) as f:
+            if max_age is not None:
+                if time.time() - os.fstat(f.fileno()).st_mtime > max_age:
+                    return None
+            return cast(dict[str, Any], json.load(f))
     except (OSError, json.JSONDecodeError):
-        pass
+        return None
+
+
+def get_cached_or_fetch_data() -> dict[str, Any] | None:
+    """Get model data from cache or fetch from API if cache is expired or does not exist."""
+    data = _read_cache_file(CACHE_TTL_SECONDS)
+    if data is not None:
+        return data
+
+    return _fetch_to_cache()
+
+
+def _fetch_to_cache() -> dict[str, Any] | None:
+    """Fetch model data from the API and write it to the cache file."""
+    import urllib.error
+    import urllib.request
 
     url = "https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json"
     try:
         with urllib.request.urlopen(url, timeout=5) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            try:
-                with open(CACHE_FILE, "w") as f:
-                    json.dump(data, f)
-            except OSError:
-                pass
-            return cast(dict[str, Any], data)
+            data = _slim_model_data(json.loads(response.read()))
+            _write_cache_file(data)
+            return data
     except (
         urllib.error.URLError,
         urllib.error.HTTPError,
@@ -87,26 +127,139 @@ def get_cached_or_fetch_data() -> dict[str, Any] | None:
         return None
 
 
+def _write_cache_file(data: dict[str, Any]) -> None:
+    """Atomically replace the model data cache, ignoring failures.
+
+    Written to a unique temp file and renamed, as other statusline
+    processes may be reading the cache meanwhile.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f"{CACHE_FILE_NAME}.", suffix=".tmp", dir=os.path.dirname(CACHE_FILE)
+        )
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+_LIMIT_FIELDS = ("max_input_tokens", "max_tokens")
+
+
+def _slim_model_data(data: Any) -> dict[str, Any]:
+    """Keep only the fields extract_token_limit reads, for models that have them.
+
+    The upstream file carries pricing and capability flags for every model,
+    which makes the cache several times larger than needed. Dropping models
+    without a limit leaves lookups unchanged, as those are skipped anyway.
+    """
+    if not isinstance(data, dict):
+        return {}
+
+    slim = {}
+    for key, info in data.items():
+        if isinstance(info, dict):
+            fields = {name: info[name] for name in _LIMIT_FIELDS if info.get(name)}
+            if fields:
+                slim[key] = fields
+    return slim
+
+
 def _is_cache_stale() -> bool:
     """Check if the model data cache is stale or missing."""
     try:
-        if not os.path.exists(CACHE_FILE):
-            return True
         cache_age = time.time() - os.path.getmtime(CACHE_FILE)
-        return cache_age > CACHE_TTL_SECONDS
     except OSError:
         return True
+    return cache_age > CACHE_TTL_SECONDS
+
+
+_refresh_checked = False
 
 
 def _maybe_refresh_cache_background() -> None:
-    """Refresh model cache in background if stale (non-blocking)."""
+    """Refresh model cache in background if stale (non-blocking).
+
+    Checked at most once per process.
+    """
+    global _refresh_checked
+    if _refresh_checked:
+        return
+    _refresh_checked = True
+
     if _is_cache_stale():
-        thread = threading.Thread(target=get_cached_or_fetch_data, daemon=True)
-        thread.start()
+        _spawn_cache_refresh()
+
+
+def _spawn_cache_refresh() -> None:
+    """Run _fetch_to_cache in a detached process.
+
+    A thread would be killed when the statusline exits, usually long before
+    the download completes. Only the run that claims the marker file starts
+    a download.
+    """
+    if not _claim_refresh_marker():
+        return
+
+    import subprocess
+    import sys
+
+    try:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "from claude_code_statusline.utils.models import _fetch_to_cache; "
+                "_fetch_to_cache()",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+# Exclusive create: atomic between concurrent runs, and never follows a
+# symlink planted at the predictable path in the shared temp directory
+_MARKER_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0)
+
+
+def _claim_refresh_marker() -> bool:
+    """Create the refresh marker, or return False if a recent one exists.
+
+    A marker older than REFRESH_RETRY_SECONDS is left from a refresh that
+    failed or died, and is replaced so the fetch is retried.
+    """
+    for _ in range(2):
+        try:
+            os.close(os.open(REFRESH_MARKER_FILE, _MARKER_FLAGS, 0o600))
+            return True
+        except FileExistsError:
+            try:
+                age = time.time() - os.lstat(REFRESH_MARKER_FILE).st_mtime
+                if age < REFRESH_RETRY_SECONDS:
+                    return False
+                os.unlink(REFRESH_MARKER_FILE)
+            except OSError:
+                return False
+        except OSError:
+            return False
+    return False
 
 
 _prefetched_model_data = None
 _prefetch_done = False
+_prefetch_thread: threading.Thread | None = None
 
 
 def prefetch_model_data() -> None:
@@ -116,9 +269,50 @@ def prefetch_model_data() -> None:
     _prefetch_done = True
 
 
+def start_model_data_prefetch() -> threading.Thread:
+    """Run prefetch_model_data on a daemon thread.
+
+    The thread never delays process exit; get_context_limit only waits for
+    it when a lookup actually needs the API data.
+
+    Returns:
+        The started thread
+    """
+    global _prefetch_thread
+    _prefetch_thread = threading.Thread(target=prefetch_model_data, daemon=True)
+    _prefetch_thread.start()
+    return _prefetch_thread
+
+
+def _wait_for_model_data() -> dict[str, Any] | None:
+    """Get prefetched model data, waiting at most FETCH_WAIT_SECONDS.
+
+    Starts the prefetch if nothing did yet. If it is still fetching when
+    the wait runs out, the cache file is used regardless of age. The fetch
+    carries on in the background, and a stale cache is also handed to the
+    detached refresh, since the prefetch thread dies with the process.
+    """
+    if _prefetch_done:
+        return _prefetched_model_data
+
+    thread = _prefetch_thread
+    if thread is None:
+        thread = start_model_data_prefetch()
+    thread.join(FETCH_WAIT_SECONDS)
+
+    if _prefetch_done:
+        return _prefetched_model_data
+
+    _maybe_refresh_cache_background()
+    return _read_cache_file()
+
+
 def get_context_limit(model_id: str, model_name: str = "") -> int:
     """Get context limit for model, checking hardcoded limits first for speed.
 
+    Lookups are memoized for the life of the process, except fallbacks
+    given while no API data was available.
+
     Args:
         model_id: Model identifier (e.g., "claude-sonnet-4-5-20250929")
         model_name: Optional display name
@@ -126,51 +320,87 @@ def get_context_limit(model_id: str, model_name: str = "") -> int:
     Returns:
         Context limit in tokens
     """
+    known = _lookup_known_limit(model_id, model_name)
+    if known is None:
+        return _lookup_api_limit(model_id)
+
+    limit, from_table = known
+    if from_table:
+        _maybe_refresh_cache_background()
+    return limit
+
+
+@lru_cache(maxsize=128)
+def _lookup_known_limit(model_id: str, model_name: str) -> tuple[int, bool] | None:
+    """Resolve a context limit without API data, noting if MODEL_INFO supplied it.
+
+    Returns None for models that need the API data. Side effects are left
+    to get_context_limit so cache hits keep them.
+    """
     if not model_id:
-        return MODEL_INFO["default"].context_limit
+        return _DEFAULT_CONTEXT_LIMIT, False
+
+    model_lower = model_id.lower()
 
-    if "[1m]" in model_id.lower():
-        return 1000000
+    if "[1m]" in model_lower:
+        return 1000000, False
 
     if model_name and "1m" in model_name.lower():
-        return 1000000
+        return 1000000, False
 
-    model_lower = model_id.lower()
+    info = MODEL_INFO.get(model_lower)
+    if info is not None:
+        return info.context_limit, True
 
-    if model_lower in MODEL_INFO:
-        _maybe_refresh_cache_background()
-        return MODEL_INFO[model_lower].context_limit
+    for key in _MODEL_INFO_KEYS_BY_LEN:
+        if model_lower in key or key in model_lower:
+            return MODEL_INFO[key].context_limit, True
 
-    for key in sorted(MODEL_INFO.keys(), key=len, reverse=True):
-        if key != "default" and (model_lower in key or key in model_lower):
-            _maybe_refresh_cache_background()
-            return MODEL_INFO[key].context_limit
+    return None
 
-    global _prefetched_model_data, _prefetch_done
-    if _prefetch_done:
-        api_data = _prefetched_model_data
-    else:
-        api_data = get_cached_or_fetch_data()
 
-    if api_data:
-        if model_id in api_data:
-            limit = extract_token_limit(api_data[model_id])
-            if limit:
-                return limit
+_api_limits: dict[str, int] = {}
+
+
+def _lookup_api_limit(model_id: str) -> int:
+    """Resolve a context limit from the API data, memoizing conclusive results.
+
+    When no data is available yet, the default is returned without being
+    remembered, so a later lookup can still use the data once it arrives.
+    """
+    limit = _api_limits.get(model_id)
+    if limit is not None:
+        return limit
+
+    api_data = _wait_for_model_data()
+    if api_data is None:
+        return _DEFAULT_CONTEXT_LIMIT
+
+    limit = _find_api_limit(api_data, model_id) or _DEFAULT_CONTEXT_LIMIT
+    _api_limits[model_id] = limit
+    return limit
 
-        if model_lower in api_data:
-            limit = extract_token_limit(api_data[model_lower])
+
+def _find_api_limit(api_data: dict[str, Any], model_id: str) -> int | None:
+    """Find model_id's limit in the API data, exactly or by substring."""
+    if model_id in api_data:
+        limit = extract_token_limit(api_data[model_id])
+        if limit:
+            return limit
+
+    model_lower = model_id.lower()
+    if model_lower in api_data:
+        limit = extract_token_limit(api_data[model_lower])
+        if limit:
+            return limit
+
+    for key, key_lower in _get_api_keys_by_len(api_data):
+        if model_lower in key_lower or key_lower in model_lower:
+            limit = extract_token_limit(api_data[key])
             if limit:
                 return limit
 
-        for key in sorted(api_data.keys(), key=len, reverse=True):
-            key_lower = key.lower()
-            if model_lower in key_lower or key_lower in model_lower:
-                limit = extract_token_limit(api_data[key])
-                if limit:
-                    return limit
-
-    return MODEL_INFO["default"].context_limit
+    return None
 
 
 def get_current_context_length(context: RenderContext) -> int:
@@ -208,10 +438,16 @@ def get_context_limit_for_render(context: RenderContext) -> int:
     Returns:
         Context limit for the model in the render context
     """
+    if context.context_limit is not None:
+        return context.context_limit
+
     if context.context_window and context.context_window.context_window_size > 0:
-        return context.context_window.context_window_size
+        limit = context.context_window.context_window_size
+    else:
+        model = context.model
+        model_id = model.get("id", "")
+        model_name = model.get("display_name", "")
+        limit = get_context_limit(model_id, model_name)
 
-    model = context.data.get("model") or {}
-    model_id = model.get("id", "")
-    model_name = model.get("display_name", "")
-    return get_context_limit(model_id, model_name)
+    context.context_limit = limit
+    return limit
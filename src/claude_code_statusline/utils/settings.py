@@ -1,11 +1,32 @@
 """Utilities for managing Claude Code settings.json file."""
 
+import copy
 import json
 import shutil
 import time
 
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+
+try:
+    import orjson
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        return cast(
+            bytes,
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE),
+        )
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        # Raw UTF-8 like orjson, so the file is the same bytes either way
+        return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 __all__ = [
     "get_settings_path",
@@ -25,24 +46,43 @@ def get_settings_path() -> Path:
     return Path.home() / ".claude" / "settings.json"
 
 
+_settings_cache: tuple[Path, int, int, dict[str, Any]] | None = None
+
+
 def read_settings() -> dict[str, Any]:
     """Read Claude Code settings.
 
+    The parsed file is memoized on its path, mtime and size; callers get a
+    deep copy they are free to modify.
+
     Returns:
         Dictionary with settings, or empty dict if file doesn't exist
     """
+    global _settings_cache
+
     settings_path = get_settings_path()
 
-    if not settings_path.exists():
+    try:
+        st = settings_path.stat()
+    except OSError:
         return {}
 
+    if _settings_cache is not None:
+        cached_path, mtime_ns, size, cached = _settings_cache
+        if (cached_path, mtime_ns, size) == (settings_path, st.st_mtime_ns, st.st_size):
+            return copy.deepcopy(cached)
+
     try:
-        with open(settings_path, encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, OSError):
+        data = _loads(settings_path.read_bytes())
+    except (ValueError, OSError):
+        return {}
+
+    if not isinstance(data, dict):
         return {}
 
+    _settings_cache = (settings_path, st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
 
 def write_settings(data: dict[str, Any], backup: bool = True) -> Path | None:
     """Write Claude Code settings.
@@ -51,6 +91,9 @@ def write_settings(data: dict[str, Any], backup: bool = True) -> Path | None:
         data: Settings dictionary to write
         backup: If True, create timestamped backup before writing
 
+    Leaves the file untouched, without a backup, if it already holds
+    exactly this content.
+
     Returns:
         Path to backup file if created, None otherwise
 
@@ -59,6 +102,13 @@ def write_settings(data: dict[str, Any], backup: bool = True) -> Path | None:
     """
     settings_path = get_settings_path()
     settings_dir = settings_path.parent
+    content = _dumps(data)
+
+    try:
+        if settings_path.read_bytes() == content:
+            return None
+    except OSError:
+        pass
 
     settings_dir.mkdir(parents=True, exist_ok=True)
 
@@ -68,9 +118,7 @@ def write_settings(data: dict[str, Any], backup: bool = True) -> Path | None:
         backup_path = settings_path.parent / f"settings.json.backup.{timestamp}"
         shutil.copy2(settings_path, backup_path)
 
-    with open(settings_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    settings_path.write_bytes(content)
 
     return backup_path
 
@@ -18,6 +18,8 @@ class Widget(ABC):
     default_color: str = "white"
     default_priority: int = 50
     fallback_text: str | None = None
+    # Set on widgets that read git status, so main() can prefetch it
+    uses_git: bool = False
 
     @abstractmethod
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
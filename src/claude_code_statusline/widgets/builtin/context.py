@@ -75,15 +75,11 @@ class ContextPercentageWidget(Widget):
 
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render context percentage with progress bar and token count."""
-        data = self._get_context_data(context)
-        if data is None:
+        compact = self.render_compact(config, context)
+        if compact is None:
             return None
 
-        _, colored_bar, pct_str, context_length, context_limit = data
-        current = format_number(context_length)
-        limit = format_number(context_limit)
-
-        return f"Context: {colored_bar} {pct_str} ({current}/{limit})"
+        return "Context: " + compact
 
     def render_compact(
         self, config: WidgetConfigModel, context: RenderContext
@@ -20,8 +20,7 @@ class CostWidget(Widget):
 
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render cost in USD."""
-        cost = context.data.get("cost") or {}
-        total_cost = cost.get("total_cost_usd")
+        total_cost = context.cost.get("total_cost_usd")
 
         if total_cost is None:
             return None
@@ -35,8 +34,7 @@ class CostWidget(Widget):
         self, config: WidgetConfigModel, context: RenderContext
     ) -> str | None:
         """Compact: just the dollar amount with color, no label."""
-        cost = context.data.get("cost") or {}
-        total_cost = cost.get("total_cost_usd")
+        total_cost = context.cost.get("total_cost_usd")
 
         if total_cost is None:
             return None
@@ -57,10 +55,9 @@ class LinesAddedWidget(Widget):
 
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render lines added."""
-        cost = context.data.get("cost") or {}
-        lines_added = cost.get("total_lines_added")
+        lines_added = context.cost.get("total_lines_added")
 
-        if not lines_added or lines_added == 0:
+        if not lines_added:
             return None
 
         return f"+{lines_added} (added)"
@@ -69,10 +66,9 @@ class LinesAddedWidget(Widget):
         self, config: WidgetConfigModel, context: RenderContext
     ) -> str | None:
         """Compact: just +N, no label."""
-        cost = context.data.get("cost") or {}
-        lines_added = cost.get("total_lines_added")
+        lines_added = context.cost.get("total_lines_added")
 
-        if not lines_added or lines_added == 0:
+        if not lines_added:
             return None
 
         return f"+{lines_added}"
@@ -90,10 +86,9 @@ class LinesRemovedWidget(Widget):
 
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render lines removed."""
-        cost = context.data.get("cost") or {}
-        lines_removed = cost.get("total_lines_removed")
+        lines_removed = context.cost.get("total_lines_removed")
 
-        if not lines_removed or lines_removed == 0:
+        if not lines_removed:
             return None
 
         return f"-{lines_removed} (removed)"
@@ -102,10 +97,9 @@ class LinesRemovedWidget(Widget):
         self, config: WidgetConfigModel, context: RenderContext
     ) -> str | None:
         """Compact: just -N, no label."""
-        cost = context.data.get("cost") or {}
-        lines_removed = cost.get("total_lines_removed")
+        lines_removed = context.cost.get("total_lines_removed")
 
-        if not lines_removed or lines_removed == 0:
+        if not lines_removed:
             return None
 
         return f"-{lines_removed}"
@@ -122,43 +116,31 @@ class LinesChangedWidget(Widget):
     """Display lines added and removed in a single widget."""
 
     def _get_lines(self, context: RenderContext) -> tuple[int, int]:
-        cost = context.data.get("cost") or {}
+        cost = context.cost
         return cost.get("total_lines_added", 0), cost.get("total_lines_removed", 0)
 
+    @staticmethod
+    def _join(added: str, removed: str, separator: str) -> str | None:
+        if added and removed:
+            return f"{added}{separator}{removed}"
+        return added or removed or None
+
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render lines changed."""
         lines_added, lines_removed = self._get_lines(context)
-
-        if lines_added == 0 and lines_removed == 0:
-            return None
-
-        parts = []
-        if lines_added > 0:
-            parts.append(colorize(f"+{lines_added} (added)", "green"))
-        if lines_removed > 0:
-            parts.append(colorize(f"-{lines_removed} (removed)", "red"))
-
-        if not parts:
-            return None
-
-        return " / ".join(parts)
+        return self._join(
+            colorize(f"+{lines_added} (added)", "green") if lines_added > 0 else "",
+            colorize(f"-{lines_removed} (removed)", "red") if lines_removed > 0 else "",
+            " / ",
+        )
 
     def render_compact(
         self, config: WidgetConfigModel, context: RenderContext
     ) -> str | None:
         """Compact: +N/-M with colors, no labels."""
         lines_added, lines_removed = self._get_lines(context)
-
-        if lines_added == 0 and lines_removed == 0:
-            return None
-
-        parts = []
-        if lines_added > 0:
-            parts.append(colorize(f"+{lines_added}", "green"))
-        if lines_removed > 0:
-            parts.append(colorize(f"-{lines_removed}", "red"))
-
-        if not parts:
-            return None
-
-        return "/".join(parts)
+        return self._join(
+            colorize(f"+{lines_added}", "green") if lines_added > 0 else "",
+            colorize(f"-{lines_removed}", "red") if lines_removed > 0 else "",
+            "/",
+        )
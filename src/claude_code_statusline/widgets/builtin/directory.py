@@ -1,7 +1,5 @@
 """Directory widget."""
 
-import os
-
 from ...config.schema import WidgetConfigModel
 from ...types import RenderContext
 from ..base import Widget
@@ -20,21 +18,19 @@ from .git import _get_or_fetch_git_status
 class DirectoryWidget(Widget):
     """Display current working directory basename."""
 
+    uses_git = True
+
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render directory basename."""
-        workspace = context.data.get("workspace") or {}
-        current_dir: str | None = workspace.get("current_dir")
+        current_dir = context.cwd
 
         if not current_dir:
             return None
 
-        _get_or_fetch_git_status(context)
+        git_status = _get_or_fetch_git_status(context)
 
-        if (
-            context.git_status
-            and context.git_status.is_git_repo
-            and context.git_status.repo_name
-        ):
-            return context.git_status.repo_name
+        if git_status and git_status.repo_name:
+            return git_status.repo_name
 
-        return str(os.path.basename(current_dir))
+        # Same as os.path.basename on POSIX, as one string op
+        return current_dir.rpartition("/")[2]
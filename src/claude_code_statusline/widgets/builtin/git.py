@@ -1,22 +1,28 @@
 """Git-related widgets."""
 
 from ...config.schema import WidgetConfigModel
-from ...types import RenderContext
+from ...types import GitStatus, RenderContext
 from ...utils.git import get_git_status
 from ..base import Widget
 from ..registry import register_widget
 
 
-def _get_or_fetch_git_status(context: RenderContext) -> None:
-    """Get git status from context or fetch it."""
-    if context.git_status is not None:
-        return
+def _get_or_fetch_git_status(context: RenderContext) -> GitStatus | None:
+    """Get git status from context or fetch it.
 
-    workspace = context.data.get("workspace") or {}
-    cwd = workspace.get("current_dir")
+    Returns:
+        The status if the workspace is a git repository, otherwise None
+    """
+    if context.git_status is None:
+        cwd = context.cwd
 
-    if cwd:
-        context.git_status = get_git_status(cwd)
+        if cwd:
+            context.git_status = get_git_status(cwd)
+
+    git_status = context.git_status
+    if git_status is None or not git_status.is_git_repo:
+        return None
+    return git_status
 
 
 @register_widget(
@@ -30,17 +36,16 @@ def _get_or_fetch_git_status(context: RenderContext) -> None:
 class GitBranchWidget(Widget):
     """Display current git branch name."""
 
+    uses_git = True
+
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render git branch name."""
-        _get_or_fetch_git_status(context)
-
-        if not context.git_status or not context.git_status.is_git_repo:
-            return None
+        git_status = _get_or_fetch_git_status(context)
 
-        if not context.git_status.branch:
+        if not git_status or not git_status.branch:
             return None
 
-        return f"{context.git_status.branch}"
+        return f"{git_status.branch}"
 
 
 @register_widget(
@@ -52,15 +57,17 @@ class GitBranchWidget(Widget):
 class GitChangesWidget(Widget):
     """Display git insertions and deletions."""
 
+    uses_git = True
+
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render git changes (+insertions/-deletions)."""
-        _get_or_fetch_git_status(context)
+        git_status = _get_or_fetch_git_status(context)
 
-        if not context.git_status or not context.git_status.is_git_repo:
+        if not git_status:
             return None
 
-        insertions = context.git_status.insertions
-        deletions = context.git_status.deletions
+        insertions = git_status.insertions
+        deletions = git_status.deletions
 
         if insertions == 0 and deletions == 0:
             return None
@@ -83,14 +90,13 @@ class GitChangesWidget(Widget):
 class GitWorktreeWidget(Widget):
     """Display git worktree name."""
 
+    uses_git = True
+
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render git worktree name."""
-        _get_or_fetch_git_status(context)
-
-        if not context.git_status or not context.git_status.is_git_repo:
-            return None
+        git_status = _get_or_fetch_git_status(context)
 
-        if not context.git_status.worktree:
+        if not git_status or not git_status.worktree:
             return None
 
-        return f" [{context.git_status.worktree}]"
+        return f" [{git_status.worktree}]"
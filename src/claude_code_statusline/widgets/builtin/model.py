@@ -19,7 +19,7 @@ class ModelWidget(Widget):
 
     def render(self, config: WidgetConfigModel, context: RenderContext) -> str | None:
         """Render model display name."""
-        model = context.data.get("model") or {}
+        model = context.model
         display_name: str | None = model.get("display_name") or model.get("id")
 
         if not display_name:
@@ -1,6 +1,6 @@
 """Widget registry for managing available widgets."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 
 from .base import Widget
 
@@ -57,3 +57,19 @@ def get_widget(widget_type: str) -> Widget | None:
         Widget instance or None if not found
     """
     return _WIDGET_REGISTRY.get(widget_type)
+
+
+def any_widget_uses_git(widget_types: Iterable[str]) -> bool:
+    """Check whether any of the given widget types reads git status.
+
+    Args:
+        widget_types: Widget type identifiers
+
+    Returns:
+        True if a registered widget among them has uses_git set
+    """
+    return any(
+        widget.uses_git
+        for widget_type in widget_types
+        if (widget := _WIDGET_REGISTRY.get(widget_type)) is not None
+    )
@@ -12,6 +12,30 @@ def pytest_configure(config):
     )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(monkeypatch, tmp_path):
+    """Keep transcript scan and git status caches out of the real ~/.cache.
+
+    Also gives each test fresh model lookup state with its own model data
+    cache file, and stops table-matched lookups from launching a background
+    model data download.
+    """
+    from claude_code_statusline.utils import models
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    cache_file = str(tmp_path / models.CACHE_FILE_NAME)
+    monkeypatch.setattr(models, "CACHE_FILE", cache_file)
+    monkeypatch.setattr(models, "REFRESH_MARKER_FILE", cache_file + ".refreshing")
+    monkeypatch.setattr(models, "_refresh_checked", True)
+    monkeypatch.setattr(models, "_prefetch_done", False)
+    monkeypatch.setattr(models, "_prefetched_model_data", None)
+    monkeypatch.setattr(models, "_prefetch_thread", None)
+    monkeypatch.setattr(models, "_api_limits", {})
+    models._lookup_known_limit.cache_clear()
+    return cache_dir
+
+
 @pytest.fixture
 def mock_stdin(monkeypatch):
     """Factory fixture to mock stdin with custom content."""
@@ -19,7 +43,8 @@ def mock_stdin(monkeypatch):
     import sys
 
     def _mock_stdin(content: str):
-        monkeypatch.setattr(sys, "stdin", io.StringIO(content))
+        stdin = io.TextIOWrapper(io.BytesIO(content.encode()), encoding="utf-8")
+        monkeypatch.setattr(sys, "stdin", stdin)
 
     return _mock_stdin
 
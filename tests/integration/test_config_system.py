@@ -21,7 +21,7 @@ def temp_config_dir(monkeypatch, tmp_path):
     """Create a temporary config directory."""
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
     monkeypatch.setattr(loader, "_cached_config", None)
-    monkeypatch.setattr(loader, "_cached_mtime", 0.0)
+    monkeypatch.setattr(loader, "_cached_mtime_ns", 0)
     return tmp_path
 
 
@@ -74,6 +74,24 @@ class TestConfigV2Loading:
         assert config.version == 2
         assert config.widgets == {}
 
+    def test_reloads_on_sub_microsecond_mtime_change(self, temp_config_dir):
+        """Test that the cache is keyed on nanosecond mtime."""
+        import os
+
+        config_file = temp_config_dir / "claude-code-statusline" / "config.yaml"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text(yaml.dump({"version": 2}))
+        os.utime(config_file, ns=(1_000_000_000_000, 1_000_000_000_000))
+
+        assert load_config_file().widgets == {}
+
+        config_file.write_text(
+            yaml.dump({"version": 2, "widgets": {"model": {"color": "red"}}})
+        )
+        os.utime(config_file, ns=(1_000_000_000_001, 1_000_000_000_001))
+
+        assert load_config_file().widgets["model"].color == "red"
+
 
 class TestEffectiveWidgets:
     """Tests for get_effective_widgets()."""
@@ -3,7 +3,7 @@ import json
 import pytest
 
 from claude_code_statusline.parsers.tokens import parse_transcript
-from claude_code_statusline.statusline import parse_input_data
+from claude_code_statusline.statusline import find_transcript_path, parse_input_data
 
 
 @pytest.mark.integration
@@ -60,3 +60,22 @@ class TestSessionIdFallback:
         token_metrics, _duration = parse_transcript(str(forked_session_file))
 
         assert token_metrics.session_id != ""
+
+
+@pytest.mark.integration
+class TestTranscriptLookup:
+    """Test transcript path resolution."""
+
+    def test_returns_stat_for_existing_transcript(self, forked_session_file):
+        """The stat result is handed on so parse_transcript can reuse it."""
+        path, st = find_transcript_path({"transcript_path": str(forked_session_file)})
+
+        assert path == str(forked_session_file)
+        assert st is not None
+        assert st.st_size == forked_session_file.stat().st_size
+        assert parse_transcript(path, st) == parse_transcript(path)
+
+    def test_missing_transcript_has_no_stat(self, tmp_path):
+        missing = str(tmp_path / "missing.jsonl")
+
+        assert find_transcript_path({"transcript_path": missing}) == (missing, None)
@@ -1,3 +1,6 @@
+from pathlib import Path
+from typing import Any
+
 import pytest
 
 from claude_code_statusline.parsers.tokens import parse_transcript
@@ -61,3 +64,161 @@ class TestTranscriptEdgeCases:
         empty_file.write_text("")
         token_metrics, duration = parse_transcript(str(empty_file))
         assert token_metrics.context_length == 0
+
+    def test_large_file_without_trailing_newline(self, tmp_path):
+        """Files above the mmap threshold parse the same, including the last line."""
+        import json
+
+        from claude_code_statusline.parsers.tokens import MMAP_THRESHOLD_BYTES
+
+        filler = json.dumps({"type": "user", "message": {"content": "x" * 1000}})
+        lines = [filler] * (MMAP_THRESHOLD_BYTES // len(filler) + 1)
+        lines.append(
+            json.dumps(
+                {
+                    "sessionId": "large-session",
+                    "message": {"usage": {"input_tokens": 42}},
+                }
+            )
+        )
+        large_file = tmp_path / "large.jsonl"
+        large_file.write_text("\n".join(lines))
+        assert large_file.stat().st_size > MMAP_THRESHOLD_BYTES
+
+        token_metrics, _duration = parse_transcript(str(large_file))
+        assert token_metrics.context_length == 42
+        assert token_metrics.session_id == "large-session"
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        ["basic_session_file", "compact_session_file", "forked_session_file"],
+    )
+    def test_simdjson_backend_matches_stdlib(self, fixture_name, request, monkeypatch):
+        """The optional simdjson backend yields the same results as json/orjson."""
+        pytest.importorskip("simdjson")
+        from claude_code_statusline.parsers import tokens
+
+        path = str(request.getfixturevalue(fixture_name))
+        with_simdjson = parse_transcript(path)
+        monkeypatch.setattr(tokens, "_HAS_SIMDJSON", False)
+
+        assert parse_transcript(path) == with_simdjson
+
+
+@pytest.mark.integration
+class TestTranscriptScanOrder:
+    """Newest values come from the end, oldest from just after the last boundary."""
+
+    @staticmethod
+    def _write(tmp_path: Path, entries: list[dict[str, Any]]) -> str:
+        import json
+
+        path = tmp_path / "scan.jsonl"
+        path.write_text("".join(json.dumps(e) + "\n" for e in entries))
+        return str(path)
+
+    def test_duration_and_slug_start_after_last_boundary(self, tmp_path):
+        boundary = {
+            "type": "system",
+            "subtype": "compact_boundary",
+            "compactMetadata": {"trigger": "auto"},
+        }
+        path = self._write(
+            tmp_path,
+            [
+                {"type": "user", "slug": "old", "timestamp": "2025-01-01T08:00:00Z"},
+                boundary,
+                {"type": "user", "slug": "new", "timestamp": "2025-01-01T10:00:00Z"},
+                {"type": "assistant", "slug": "later", "message": {"content": "x"}},
+                {
+                    "type": "assistant",
+                    "timestamp": "2025-01-01T10:30:00Z",
+                    "message": {"usage": {"input_tokens": 7}},
+                },
+            ],
+        )
+
+        token_metrics, duration = parse_transcript(path)
+
+        assert token_metrics.slug == "new"
+        assert token_metrics.context_length == 7
+        assert duration == 1800
+
+    def test_session_id_falls_back_to_before_boundary(self, tmp_path):
+        path = self._write(
+            tmp_path,
+            [
+                {"sessionId": "before", "type": "user"},
+                {
+                    "type": "system",
+                    "subtype": "compact_boundary",
+                    "compactMetadata": {"trigger": "manual"},
+                },
+                {"type": "user", "message": {"content": "no session id"}},
+            ],
+        )
+
+        token_metrics, duration = parse_transcript(path)
+
+        assert token_metrics.session_id == "before"
+        assert token_metrics.had_compact_boundary is True
+        assert token_metrics.context_length == 0
+        assert duration is None
+
+
+@pytest.mark.integration
+class TestTranscriptScanCache:
+    """The on-disk scan cache only re-parses what was appended."""
+
+    @staticmethod
+    def _line(tokens: int, session_id: str = "cached-session") -> str:
+        import json
+
+        return (
+            json.dumps(
+                {
+                    "sessionId": session_id,
+                    "message": {"usage": {"input_tokens": tokens}},
+                }
+            )
+            + "\n"
+        )
+
+    def test_unchanged_transcript_skips_reading(self, tmp_path, monkeypatch):
+        from claude_code_statusline.parsers import tokens
+
+        path = tmp_path / "cached.jsonl"
+        path.write_text(self._line(10))
+        first = parse_transcript(str(path))
+
+        def fail(_path):
+            raise AssertionError("transcript should not be re-read")
+
+        monkeypatch.setattr(tokens, "_open_buffer", fail)
+        assert parse_transcript(str(path)) == first
+
+    def test_appended_lines_update_result(self, tmp_path):
+        path = tmp_path / "cached.jsonl"
+        path.write_text(self._line(10))
+        assert parse_transcript(str(path))[0].context_length == 10
+
+        partial = self._line(20, session_id="appended")
+        with open(path, "a") as f:
+            f.write(partial[:-10])
+        assert parse_transcript(str(path))[0].context_length == 10
+
+        with open(path, "a") as f:
+            f.write(partial[-10:])
+        token_metrics, _duration = parse_transcript(str(path))
+        assert token_metrics.context_length == 20
+        assert token_metrics.session_id == "appended"
+
+    def test_rewritten_transcript_is_rescanned(self, tmp_path):
+        path = tmp_path / "cached.jsonl"
+        path.write_text(self._line(10) + self._line(11))
+        assert parse_transcript(str(path))[0].context_length == 11
+
+        path.write_text(self._line(30) + self._line(31, session_id="rewritten"))
+        token_metrics, _duration = parse_transcript(str(path))
+        assert token_metrics.context_length == 31
+        assert token_metrics.session_id == "rewritten"
@@ -117,6 +117,45 @@ class TestContextWindowPriority:
         assert length == 50000
         assert limit == 200000
 
+    def test_limit_is_memoized_on_context(self, monkeypatch):
+        """Model lookup runs once per render context."""
+        from claude_code_statusline.utils import models
+
+        calls = []
+
+        def fake_get_context_limit(model_id, model_name=""):
+            calls.append(model_id)
+            return 123456
+
+        monkeypatch.setattr(models, "get_context_limit", fake_get_context_limit)
+        context = RenderContext(data={"model": {"id": "unknown-model"}})
+
+        assert get_context_limit_for_render(context) == 123456
+        assert get_context_limit_for_render(context) == 123456
+        assert calls == ["unknown-model"]
+
+
+@pytest.mark.unit
+class TestModelDataCache:
+    """Test the slimmed model data written to the cache file."""
+
+    def test_slim_keeps_only_limits(self):
+        """Pricing fields and models without limits are dropped."""
+        from claude_code_statusline.utils.models import _slim_model_data
+
+        data = {
+            "model-a": {"max_input_tokens": 100, "input_cost_per_token": 1e-6},
+            "model-b": {"max_tokens": 50, "max_input_tokens": None},
+            "model-c": {"mode": "embedding"},
+            "model-d": "not a dict",
+        }
+
+        assert _slim_model_data(data) == {
+            "model-a": {"max_input_tokens": 100},
+            "model-b": {"max_tokens": 50},
+        }
+        assert _slim_model_data([]) == {}
+
 
 @pytest.mark.unit
 class TestUsedPercentagePriority:
@@ -0,0 +1,88 @@
+"""Unit tests for git status caching."""
+
+import os
+import time
+
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_statusline.utils import git
+
+
+@pytest.fixture
+def fake_git(monkeypatch):
+    """Stub git subprocesses and reset the in-process cache."""
+    monkeypatch.setattr(git, "_git_cache", None)
+    monkeypatch.setattr(git, "_prefetch_thread", None)
+    outputs = {
+        "branch": "main",
+        "diff": " 1 file changed, 3 insertions(+), 1 deletion(-)",
+        "worktree": "/repo  abc123 [main]",
+    }
+    calls: list[list[str]] = []
+
+    def run_git(args: list[str], cwd: str | None = None) -> str:
+        calls.append(args)
+        return outputs[args[0]]
+
+    def run_git_many(commands: list[list[str]], cwd: str | None = None) -> list[str]:
+        return [run_git(args, cwd) for args in commands]
+
+    with (
+        patch.object(git, "_run_git", side_effect=run_git),
+        patch.object(git, "_run_git_many", side_effect=run_git_many),
+    ):
+        yield calls
+
+
+@pytest.mark.unit
+class TestDiskCache:
+    def test_reuses_status_from_previous_process(self, fake_git, monkeypatch):
+        first = git.get_git_status("/repo")
+        monkeypatch.setattr(git, "_git_cache", None)
+        calls_before = len(fake_git)
+
+        assert git.get_git_status("/repo") == first
+        assert len(fake_git) == calls_before
+        assert first.insertions == 6
+        assert first.deletions == 2
+
+    def test_expires_after_ttl(self, fake_git, monkeypatch):
+        git.get_git_status("/repo")
+        monkeypatch.setattr(git, "_git_cache", None)
+        calls_before = len(fake_git)
+
+        real_time = time.time
+        with patch.object(
+            time, "time", side_effect=lambda: real_time() + git.GIT_CACHE_TTL
+        ):
+            git.get_git_status("/repo")
+
+        assert len(fake_git) > calls_before
+
+    def test_index_change_invalidates(self, fake_git, monkeypatch, tmp_path):
+        index = tmp_path / ".git" / "index"
+        index.parent.mkdir()
+        index.write_bytes(b"")
+        cwd = str(tmp_path)
+
+        git.get_git_status(cwd)
+        monkeypatch.setattr(git, "_git_cache", None)
+        calls_before = len(fake_git)
+
+        stat = index.stat()
+        os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        git.get_git_status(cwd)
+
+        assert len(fake_git) > calls_before
+
+
+@pytest.mark.unit
+class TestPrefetch:
+    def test_get_waits_for_prefetch(self, fake_git):
+        git.start_git_status_prefetch("/repo")
+        status = git.get_git_status("/repo")
+
+        assert status.branch == "main"
+        assert fake_git.count(["branch", "--show-current"]) == 1
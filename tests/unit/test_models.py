@@ -0,0 +1,163 @@
+"""Unit tests for model context limit lookups."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from claude_code_statusline.utils import models
+
+
+@pytest.mark.unit
+class TestApiLimitLookup:
+    """Unknown models fall back to the API data, memoized once conclusive."""
+
+    def test_unknown_model_uses_api_data(self, monkeypatch):
+        monkeypatch.setattr(models, "_prefetch_done", True)
+        monkeypatch.setattr(
+            models, "_prefetched_model_data", {"acme-large": {"max_tokens": 64000}}
+        )
+
+        assert models.get_context_limit("acme-large-v2") == 64000
+
+    def test_result_is_memoized(self, monkeypatch):
+        calls = []
+
+        def wait_for_model_data() -> dict[str, Any]:
+            calls.append(1)
+            return {"acme-large": {"max_input_tokens": 32000}}
+
+        monkeypatch.setattr(models, "_wait_for_model_data", wait_for_model_data)
+
+        assert models.get_context_limit("acme-large") == 32000
+        assert models.get_context_limit("acme-large") == 32000
+        assert len(calls) == 1
+
+    def test_fallback_without_data_is_not_memoized(self, monkeypatch):
+        data: list[dict[str, Any] | None] = [None, {"acme": {"max_tokens": 5000}}]
+        monkeypatch.setattr(models, "_wait_for_model_data", lambda: data.pop(0))
+
+        assert models.get_context_limit("acme") == models._DEFAULT_CONTEXT_LIMIT
+        assert models.get_context_limit("acme") == 5000
+
+
+@pytest.mark.unit
+class TestWaitForModelData:
+    """Lookups never wait on the network for longer than FETCH_WAIT_SECONDS."""
+
+    def test_returns_prefetched_data_when_done(self, monkeypatch):
+        data = {"acme": {"max_tokens": 1}}
+        monkeypatch.setattr(models, "_prefetch_done", True)
+        monkeypatch.setattr(models, "_prefetched_model_data", data)
+
+        assert models._wait_for_model_data() is data
+
+    def test_starts_prefetch_when_none_running(self, monkeypatch):
+        data = {"acme": {"max_tokens": 1}}
+        monkeypatch.setattr(models, "get_cached_or_fetch_data", lambda: data)
+
+        assert models._wait_for_model_data() is data
+        assert models._prefetch_thread is not None
+
+    def test_timeout_returns_stale_cache(self, monkeypatch, tmp_path):
+        release = threading.Event()
+        monkeypatch.setattr(models, "get_cached_or_fetch_data", release.wait)
+        with open(models.CACHE_FILE, "w") as f:
+            json.dump({"acme": {"max_tokens": 7}}, f)
+        os.utime(models.CACHE_FILE, (0, 0))
+
+        try:
+            assert models._wait_for_model_data() == {"acme": {"max_tokens": 7}}
+            assert models._prefetch_done is False
+        finally:
+            release.set()
+            thread = models._prefetch_thread
+            assert thread is not None
+            thread.join()
+
+
+@pytest.mark.unit
+class TestSpawnCacheRefresh:
+    """Only one statusline run at a time starts the detached download."""
+
+    @pytest.fixture
+    def popen(self):
+        with patch("subprocess.Popen") as popen:
+            yield popen
+
+    def test_spawns_detached_fetch_and_claims_marker(self, popen):
+        models._spawn_cache_refresh()
+
+        popen.assert_called_once()
+        args, kwargs = popen.call_args
+        assert args[0][0] == sys.executable
+        assert "_fetch_to_cache()" in args[0][2]
+        assert kwargs["start_new_session"] is True
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert os.path.exists(models.REFRESH_MARKER_FILE)
+
+    def test_fresh_marker_skips_spawn(self, popen):
+        open(models.REFRESH_MARKER_FILE, "w").close()
+
+        models._spawn_cache_refresh()
+
+        popen.assert_not_called()
+
+    def test_expired_marker_is_retried(self, popen):
+        open(models.REFRESH_MARKER_FILE, "w").close()
+        expired = time.time() - models.REFRESH_RETRY_SECONDS - 1
+        os.utime(models.REFRESH_MARKER_FILE, (expired, expired))
+
+        models._spawn_cache_refresh()
+
+        popen.assert_called_once()
+        assert os.path.getmtime(models.REFRESH_MARKER_FILE) > expired
+
+    def test_marker_symlink_is_not_followed(self, popen, tmp_path):
+        target = tmp_path / "target"
+        target.write_text("keep")
+        os.symlink(target, models.REFRESH_MARKER_FILE)
+
+        models._spawn_cache_refresh()
+
+        popen.assert_not_called()
+        assert target.read_text() == "keep"
+
+    def test_unwritable_marker_skips_spawn(self, popen, monkeypatch, tmp_path):
+        marker = str(tmp_path / "missing" / "marker")
+        monkeypatch.setattr(models, "REFRESH_MARKER_FILE", marker)
+
+        models._spawn_cache_refresh()
+
+        popen.assert_not_called()
+
+    def test_popen_failure_is_ignored(self, popen):
+        popen.side_effect = OSError("no interpreter")
+
+        models._spawn_cache_refresh()
+
+
+@pytest.mark.unit
+class TestWriteCacheFile:
+    """The cache is replaced atomically without leaving temp files behind."""
+
+    def test_writes_cache(self, tmp_path):
+        models._write_cache_file({"acme": {"max_tokens": 1}})
+
+        with open(models.CACHE_FILE) as f:
+            assert json.load(f) == {"acme": {"max_tokens": 1}}
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+    def test_failed_replace_removes_temp_file(self, tmp_path):
+        with patch("os.replace", side_effect=OSError("read-only")):
+            models._write_cache_file({"acme": {"max_tokens": 1}})
+
+        assert not os.path.exists(models.CACHE_FILE)
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
@@ -4,10 +4,31 @@ import json
 
 from claude_code_statusline.utils.settings import (
     configure_statusline,
+    read_settings,
     remove_statusline,
+    write_settings,
 )
 
 
+class TestWriteSettings:
+    """Tests for write_settings function."""
+
+    def test_non_ascii_round_trip(self, tmp_path, monkeypatch):
+        """Non-ASCII text is written as raw UTF-8 and read back unchanged."""
+        settings_file = tmp_path / "settings.json"
+
+        monkeypatch.setattr(
+            "claude_code_statusline.utils.settings.get_settings_path",
+            lambda: settings_file,
+        )
+
+        data = {"name": "Café ☕", "nested": {"ключ": "値"}}
+        write_settings(data, backup=False)
+
+        assert "Café ☕".encode() in settings_file.read_bytes()
+        assert read_settings() == data
+
+
 class TestConfigureStatusline:
     """Tests for configure_statusline function."""
 
@@ -61,6 +82,22 @@ class TestConfigureStatusline:
         assert result["anotherKey"]["nested"] == "value"
         assert result["statusLine"]["command"] == "claude-code-statusline"
 
+    def test_reinstall_skips_backup(self, tmp_path, monkeypatch):
+        """Configuring twice leaves the file alone the second time."""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text(json.dumps({}))
+
+        monkeypatch.setattr(
+            "claude_code_statusline.utils.settings.get_settings_path",
+            lambda: settings_file,
+        )
+
+        configure_statusline()
+        success, _ = configure_statusline()
+
+        assert success is True
+        assert list(tmp_path.glob("settings.json.backup.*")) == []
+
 
 class TestRemoveStatusline:
     """Tests for remove_statusline function."""
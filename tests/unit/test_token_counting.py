@@ -1,6 +1,8 @@
 import json
 import tempfile
 
+from unittest.mock import patch
+
 import pytest
 
 from claude_code_statusline.parsers.jsonl import (
@@ -121,6 +123,18 @@ class TestImageFiltering:
         chars = extract_message_content_chars(data)
         assert chars > 0
 
+    def test_breakdown_follows_runtime_debug_flag(self):
+        """Toggling debug.DEBUG_ENABLED after import should take effect."""
+        data = {"message": {"role": "user", "content": "hello"}}
+
+        with (
+            patch("claude_code_statusline.utils.debug.DEBUG_ENABLED", True),
+            patch("claude_code_statusline.parsers.jsonl.debug_log") as log,
+        ):
+            extract_message_content_chars(data, detailed_debug=True)
+
+        assert log.called
+
 
 @pytest.mark.unit
 class TestTokenParserCompactBoundary:
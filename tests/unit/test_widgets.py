@@ -31,6 +31,7 @@ from claude_code_statusline.widgets.builtin.session import (
     SessionIdWidget,
     SessionNameWidget,
 )
+from claude_code_statusline.widgets.registry import any_widget_uses_git
 
 
 @pytest.fixture
@@ -432,3 +433,16 @@ class TestSessionNameWidget:
         widget = SessionNameWidget()
         result = widget.render_compact(widget_config, context)
         assert result is None
+
+
+class TestAnyWidgetUsesGit:
+    def test_git_backed_widgets(self):
+        for widget_type in ("directory", "git-branch", "git-changes", "git-worktree"):
+            assert any_widget_uses_git([widget_type])
+
+    def test_widgets_without_git(self):
+        assert not any_widget_uses_git(["model", "cost", "separator"])
+
+    def test_ignores_unknown_types(self):
+        assert not any_widget_uses_git(["no-such-widget"])
+        assert any_widget_uses_git(["no-such-widget", "git-branch"])